@@ -0,0 +1,310 @@
+import streamlit as st
+import pandas as pd
+
+from menlo_analytics.ingest import HAS_PYARROW
+from menlo_analytics.metrics import METRICS
+from menlo_analytics.snapshot import SNAPSHOT_FORMATS, export_snapshot, read_snapshot, restore_snapshot
+from menlo_data import (
+    current_partition, get_performance_store, start_season_parse, start_upload_parse, validate_season_file,
+    validate_week_upload
+)
+from menlo_profiling import section
+from menlo_tables import frame_source, paginated_table
+from menlo_widgets import parsed_upload
+
+# Parquet and Feather/Arrow uploads, and season snapshots, are only offered when pyarrow is installed
+COLUMNAR_TYPES = ['parquet', 'feather', 'arrow'] if HAS_PYARROW else []
+
+store = get_performance_store()
+roster = store.roster
+
+st.header("📋 Data Input & Roster Management")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.subheader("📤 Upload Weekly Performance Data")
+    
+    uploaded_file = st.file_uploader(
+        "Upload a CSV, Excel, Parquet or Feather file with athlete performance data",
+        type=['csv', 'xlsx'] + COLUMNAR_TYPES,
+        help="File should contain columns: Name, Body Weight (lbs), Bench Press (lbs), etc."
+    )
+    
+    col_week, col_date = st.columns(2)
+    
+    with col_week:
+        week_number = st.number_input(
+            "Select Week Number",
+            min_value=1,
+            value=max(store.weeks, default=0) + 1,
+            step=1,
+            help="Each testing session gets its own number; defaults to the one after the last saved"
+        )
+    
+    with col_date:
+        saved_date = store.session_dates.get(week_number)
+        session_date = st.date_input(
+            "📅 Session Date",
+            value=None if saved_date is None else saved_date.date(),
+            help="When the testing happened; charts and date ranges place the session on this day. "
+                 "Optional: leave it blank to save an undated week"
+        )
+    
+    if uploaded_file is not None:
+        try:
+            # Parsed on a worker thread and shared by content hash; None while still reading
+            parsed = parsed_upload(uploaded_file, start_upload_parse, "upload")
+            
+            if parsed is not None:
+                df, content_hash = parsed
+                st.success(f"✅ File loaded successfully! {len(df)} records found.")
+                
+                # Preview the data
+                with st.expander("👀 Preview Uploaded Data"):
+                    paginated_table("upload_preview", frame_source(df), list(df.columns), page_sizes=(10, 25, 100))
+                
+                # Validate required columns
+                required_cols = ['Name']
+                missing_cols = [col for col in required_cols if col not in df.columns]
+                
+                if not missing_cols and not any(metric in df.columns for metric in METRICS):
+                    missing_cols = ['at least one performance metric']
+                
+                if missing_cols:
+                    st.error(f"❌ Missing required columns: {', '.join(missing_cols)}")
+                else:
+                    clean_df, issues_df = validate_week_upload(content_hash, df)
+                    
+                    if not issues_df.empty:
+                        st.warning(
+                            f"⚠️ {len(issues_df)} problems found. Unmatched rows are skipped and "
+                            f"non-numeric cells saved as blank; {len(clean_df)} athletes will be saved."
+                        )
+                        with st.expander("🔎 Review Problems"):
+                            st.dataframe(issues_df, use_container_width=True, hide_index=True)
+                    
+                    if st.button(f"✅ Confirm & Save Week {week_number} Data", type="primary"):
+                        # Save to the shared store; every session sees the new week on its next rerun
+                        store.save_week(week_number, clean_df, session_date)
+                        st.success(f"🎉 Week {week_number} data saved successfully!")
+                        st.rerun()
+        
+        except Exception as e:
+            st.error(f"❌ Error reading file: {str(e)}")
+    
+    st.subheader("📦 Bulk Season Import")
+    
+    season_file = st.file_uploader(
+        "Upload a workbook with one sheet per week, a ZIP of weekly files, or a device export",
+        type=['xlsx', 'zip', 'csv'] + COLUMNAR_TYPES,
+        key="season_upload",
+        help="Sheet and file names must contain the week number or the session date, "
+             "e.g. 'Week 3', 'football_2025_week03.csv' or '2025-08-14.csv'. A single CSV/Parquet/Feather "
+             "export is split into sessions by its Week and/or Date columns"
+    )
+    
+    if season_file is not None:
+        try:
+            parsed = parsed_upload(season_file, start_season_parse, "season_upload")
+            
+            if parsed is not None:
+                frames, content_hash = parsed
+                season_weeks, season_dates, problems, issues_df = validate_season_file(content_hash, frames)
+                
+                if problems:
+                    st.error("❌ Season file has problems; nothing was saved:\n\n" + "\n".join(f"- {p}" for p in problems))
+                else:
+                    st.success(f"✅ Found {len(season_weeks)} weeks.")
+                    
+                    if not issues_df.empty:
+                        st.warning(
+                            f"⚠️ {len(issues_df)} row/cell problems found. Unmatched rows are skipped "
+                            f"and non-numeric cells saved as blank."
+                        )
+                        with st.expander("🔎 Review Problems"):
+                            st.dataframe(issues_df, use_container_width=True, hide_index=True)
+                    st.dataframe(
+                        pd.DataFrame({
+                            'Week': list(season_weeks),
+                            'Date': [season_dates.get(w) for w in season_weeks],
+                            'Records': [len(df) for df in season_weeks.values()],
+                            'Replaces Saved Data': ['Yes' if store.has_week(w) else '' for w in season_weeks]
+                        }),
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                    
+                    if st.button(f"✅ Confirm & Save {len(season_weeks)} Weeks", type="primary"):
+                        # All weeks are written together; a failure leaves the saved season unchanged
+                        store.save_weeks(season_weeks, season_dates)
+                        st.success(f"🎉 Saved Weeks {', '.join(str(w) for w in season_weeks)}!")
+                        st.rerun()
+        
+        except Exception as e:
+            st.error(f"❌ Error reading season file: {str(e)}")
+
+with col2:
+    st.subheader("📊 Data Upload Status")
+    
+    record_counts = store.record_counts
+    session_dates = store.session_dates
+    if not record_counts:
+        st.markdown("⬜ No weeks saved yet")
+    elif len(record_counts) > 20:
+        # Many sessions: one table instead of a line per week
+        st.dataframe(
+            pd.DataFrame({
+                'Week': store.weeks,
+                'Date': [session_dates.get(week) for week in store.weeks],
+                'Records': [record_counts[week] for week in store.weeks]
+            }),
+            hide_index=True,
+            height=400,
+            column_config={'Date': st.column_config.DateColumn(format="YYYY-MM-DD")}
+        )
+    else:
+        for week in range(1, max(store.weeks) + 1):
+            if week in record_counts:
+                dated = f" ({session_dates[week]:%b %d})" if week in session_dates else ""
+                st.markdown(f"✅ **Week {week}**{dated} - {record_counts[week]} records")
+            else:
+                st.markdown(f"⬜ **Week {week}** - No data")
+
+st.markdown("---")
+
+# Display Master Roster
+st.subheader(f"👥 Master Roster ({len(roster)} Athletes)")
+
+# Add filters
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    position_filter = st.multiselect(
+        "Filter by Position",
+        options=roster.position_groups,
+        default=roster.position_groups
+    )
+
+with col2:
+    search_name = st.text_input("🔍 Search by Name", "")
+
+# Apply filters
+with section("roster filter"):
+    roster_df = roster.frame[roster.frame['Position'].isin(position_filter)]
+    if search_name:
+        roster_df = roster_df[roster_df['Name'].isin(roster.name_index.search(search_name, limit=None))]
+
+# Display counts by position
+st.markdown("**Position Distribution:**")
+pos_counts = roster.frame['Position'].value_counts()
+
+for col, position in zip(st.columns(len(roster.position_groups)), roster.position_groups):
+    with col:
+        st.metric(position, pos_counts.get(position, 0))
+
+paginated_table("roster", frame_source(roster_df), list(roster_df.columns))
+
+# Browse saved weeks one page at a time; filtering and sorting run in the store
+if store.weeks:
+    st.markdown("---")
+    st.subheader("🗂️ Saved Weekly Data")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        browse_weeks = st.multiselect("Weeks", options=store.weeks, placeholder="All weeks")
+    
+    with col2:
+        browse_positions = st.multiselect(
+            "Positions",
+            options=roster.position_groups,
+            default=roster.position_groups,
+            key="browse_positions"
+        )
+    
+    with col3:
+        browse_name = st.text_input("🔍 Search by Name", "", key="browse_name")
+    
+    paginated_table(
+        "saved_weeks",
+        lambda sort_by, descending, limit, offset: store.browse(
+            browse_weeks, browse_name, browse_positions, sort_by, descending, limit, offset
+        ),
+        ['Week', 'Name', 'Position'] + METRICS
+    )
+
+# Download template
+st.markdown("---")
+st.subheader("📥 Download Data Entry Template")
+
+template_df = pd.DataFrame({
+    'Name': roster.names,
+    'Body Weight (lbs)': [''] * len(roster),
+    'Bench Press (lbs)': [''] * len(roster),
+    'Back Squat (lbs)': [''] * len(roster),
+    'Hex Bar Deadlift (lbs)': [''] * len(roster),
+    'Flying 10 Sprint (seconds)': [''] * len(roster),
+    'Vertical Jump (inches)': [''] * len(roster),
+    'Power Clean (lbs)': [''] * len(roster)
+})
+
+csv = template_df.to_csv(index=False)
+st.download_button(
+    label="📥 Download CSV Template",
+    data=csv,
+    file_name="menlo_performance_template.csv",
+    mime="text/csv"
+)
+
+# Whole-season snapshot: roster, every week and its scores in one columnar file
+st.markdown("---")
+st.subheader("💾 Export & Restore Season")
+
+if not HAS_PYARROW:
+    st.info("ℹ️ Season export and restore need pyarrow installed.")
+else:
+    team, season = current_partition()
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        snapshot_format = st.radio(
+            "Format",
+            list(SNAPSHOT_FORMATS),
+            format_func={'parquet': "Parquet (for analysts' tools)", 'arrow': "Arrow (fastest to restore)"}.get,
+            horizontal=True
+        )
+        # Built only when clicked, on a separate thread, so the page does not pay for it on every rerun
+        st.download_button(
+            label=f"📥 Export {team} {season} ({len(roster)} athletes, {len(store.weeks)} weeks)",
+            data=lambda: export_snapshot(store, team, season, snapshot_format),
+            file_name=f"menlo_{team}_{season}{SNAPSHOT_FORMATS[snapshot_format]}".replace(' ', '_'),
+            mime="application/octet-stream",
+            on_click='ignore'
+        )
+    
+    with col2:
+        snapshot_file = st.file_uploader(
+            "Restore a season export",
+            type=['parquet', 'arrow', 'feather'],
+            key="season_restore",
+            help="Replaces this season's roster and position groups, and the saved weeks the file has"
+        )
+        
+        if snapshot_file is not None:
+            try:
+                snapshot_roster, snapshot_weeks, snapshot_dates, snapshot_info = read_snapshot(snapshot_file.getvalue())
+                replaced = [week for week in snapshot_weeks if store.has_week(week)]
+                st.info(
+                    f"ℹ️ {snapshot_info['team']} {snapshot_info['season']}, exported {snapshot_info['exported_at']}: "
+                    f"{len(snapshot_roster)} athletes and {len(snapshot_weeks)} weeks."
+                    + (f" Replaces saved Weeks {', '.join(map(str, replaced))}." if replaced else "")
+                )
+                
+                if st.button(f"♻️ Restore into {team} {season}", type="primary"):
+                    restore_snapshot(store, snapshot_roster, snapshot_weeks, snapshot_dates)
+                    st.success(f"🎉 Restored {len(snapshot_weeks)} weeks!")
+                    st.rerun()
+            
+            except Exception as e:
+                st.error(f"❌ Error reading season export: {str(e)}")
@@ -0,0 +1,79 @@
+import streamlit as st
+
+from menlo_analytics.metrics import METRICS
+from menlo_data import get_performance_store
+from menlo_profiling import section
+
+store = get_performance_store()
+
+st.header("🏆 Team Leaderboard")
+
+if not store.weeks:
+    st.warning("⚠️ No weekly data available. Please upload data in the 'Data Input & Roster' tab.")
+else:
+    available_weeks = store.weeks
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        selected_week = st.selectbox("📅 Select Week", options=available_weeks, index=len(available_weeks) - 1)
+    
+    with col2:
+        selected_metric = st.selectbox("📊 Select Metric", options=["Overall"] + METRICS)
+    
+    with col3:
+        sort_by = st.selectbox("↕️ Sort By", options=["Rank", "Most Improved"])
+    
+    position_filter = st.multiselect(
+        "Filter by Position",
+        options=store.roster.position_groups,
+        default=store.roster.position_groups,
+        key="leaderboard_positions"
+    )
+    
+    leaderboard = store.leaderboard(selected_week)
+    previous_weeks = [w for w in available_weeks if w < selected_week]
+    
+    with section("leaderboard table"):
+        if selected_metric == "Overall":
+            # Average standing across every metric the athlete was tested on
+            table = leaderboard.groupby(level='Name').agg(
+                Position=('Position', 'first'),
+                Metrics=('Value', 'count'),
+                Percentile=('Percentile', 'mean'),
+                **{'Improvement %': ('Improvement %', 'mean')}
+            )
+            table.insert(0, 'Rank', table['Percentile'].rank(ascending=False, method='min'))
+        elif selected_metric in leaderboard.index.get_level_values('Metric'):
+            table = leaderboard.loc[selected_metric]
+        else:
+            table = leaderboard.iloc[:0].droplevel('Metric')
+        
+        table = table[table['Position'].isin(position_filter)]
+        if sort_by == "Most Improved":
+            table = table.sort_values('Improvement %', ascending=False, na_position='last')
+        else:
+            table = table.sort_values('Rank')
+    
+    if table.empty:
+        st.info(f"ℹ️ No {selected_metric} data for Week {selected_week}")
+    else:
+        if previous_weeks:
+            st.caption(f"Change is measured against Week {previous_weeks[-1]}. Sprint: lower times rank higher.")
+        else:
+            st.caption("No earlier week to compare against. Sprint: lower times rank higher.")
+        
+        with section("leaderboard render"):
+            st.dataframe(
+                table.reset_index(),
+                use_container_width=True,
+                hide_index=True,
+                height=600,
+                column_config={
+                    'Rank': st.column_config.NumberColumn(format="%d"),
+                    'Value': st.column_config.NumberColumn(format="%.2f"),
+                    'Percentile': st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f"),
+                    'Change': st.column_config.NumberColumn(format="%+.2f"),
+                    '% Change': st.column_config.NumberColumn(format="%+.1f%%"),
+                    'Improvement %': st.column_config.NumberColumn(format="%+.1f%%")
+                }
+            )
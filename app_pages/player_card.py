@@ -0,0 +1,155 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from menlo_analytics.cards import HTML
+from menlo_analytics.reports import build_progress_rows, export_player_cards
+from menlo_charts import cached_figure, weight_trend_figure
+from menlo_data import build_player_cards, get_athlete_data_for_week, get_performance_store
+from menlo_profiling import section
+from menlo_widgets import athlete_picker
+
+store = get_performance_store()
+roster = store.roster
+
+st.header("🎴 Printable Player Card")
+
+if not store.weeks:
+    st.warning("⚠️ No weekly data available. Please upload data in the 'Data Input & Roster' tab.")
+else:
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        selected_athlete = athlete_picker("🔍 Select Athlete", roster, key="card_athlete")
+    
+    available_weeks = store.weeks
+    span = store.date_span()
+    if span is not None:
+        # Narrow the week choices to the sessions in a date range
+        with col1:
+            date_range = st.date_input(
+                "📅 Sessions Between",
+                value=(span[0].date(), span[1].date()),
+                min_value=span[0].date(),
+                max_value=span[1].date()
+            )
+        if len(date_range) == 2 and (pd.Timestamp(date_range[0]), pd.Timestamp(date_range[1])) != span:
+            available_weeks = sorted(store.sessions_between(*date_range)) or available_weeks
+    
+    def week_label(week_num):
+        date = store.session_dates.get(week_num)
+        return f"Week {week_num}" if date is None else f"Week {week_num} · {date:%b %d, %Y}"
+    
+    with col2:
+        start_week = st.selectbox("📅 Start Week", options=available_weeks, index=0, format_func=week_label)
+    
+    with col3:
+        end_week = st.selectbox(
+            "📅 End Week",
+            options=[w for w in available_weeks if w >= start_week],
+            index=len([w for w in available_weeks if w >= start_week]) - 1,
+            format_func=week_label
+        )
+    
+    with st.expander(f"📦 Batch Export: All Athletes, Week {start_week} to Week {end_week}"):
+        include_pdf = st.checkbox(
+            "Include PDF files",
+            disabled=HTML is None,
+            help="PDF export needs the optional WeasyPrint package" if HTML is None else None
+        )
+        
+        if st.button("🗂️ Generate All Player Cards"):
+            cards = build_player_cards(start_week, end_week)
+            if not cards:
+                st.info("ℹ️ No athletes have data in both selected weeks")
+            else:
+                progress = st.progress(0.0, text=f"Rendering {len(cards)} cards...")
+                st.session_state.card_export = {
+                    'data': export_player_cards(cards, include_pdf, progress.progress),
+                    'file_name': f"menlo_player_cards_week{start_week}-{end_week}.zip",
+                    'count': len(cards)
+                }
+        
+        card_export = st.session_state.get('card_export')
+        if card_export:
+            st.download_button(
+                label=f"📥 Download {card_export['count']} Player Cards (ZIP)",
+                data=card_export['data'],
+                file_name=card_export['file_name'],
+                mime="application/zip"
+            )
+    
+    # Get athlete info
+    athlete_position = roster.position(selected_athlete)
+    
+    start_data = get_athlete_data_for_week(selected_athlete, start_week)
+    end_data = get_athlete_data_for_week(selected_athlete, end_week)
+    
+    if start_data is None or end_data is None:
+        st.info(f"ℹ️ Data not available for selected week range")
+    else:
+        # Print button
+        st.markdown('<div class="no-print">', unsafe_allow_html=True)
+        if st.button("🖨️ Print Player Card", type="primary"):
+            st.info("💡 Use your browser's Print function (Ctrl+P or Cmd+P) to print or save as PDF")
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Player Card Layout
+        st.markdown('<div class="print-card">', unsafe_allow_html=True)
+        
+        # Header
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #002855 0%, #003366 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 20px;">
+            <h1 style="color: white; margin: 0;">{selected_athlete}</h1>
+            <p style="font-size: 20px; color: #F3C363; margin: 5px 0;">Position: {athlete_position}</p>
+            <p style="font-size: 16px; margin: 5px 0;">Performance Report: Week {start_week} to Week {end_week}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Current stats
+        if 'Body Weight (lbs)' in end_data and not pd.isna(end_data['Body Weight (lbs)']):
+            st.markdown(f"**Current Weight (Week {end_week}):** {end_data['Body Weight (lbs)']} lbs")
+        
+        st.markdown("### 📊 Performance Metrics")
+        
+        # Progress table
+        progress_data = build_progress_rows(start_data, end_data, start_week, end_week)
+        
+        if progress_data:
+            progress_df = pd.DataFrame(progress_data)
+            st.dataframe(progress_df, use_container_width=True, hide_index=True)
+        else:
+            st.info("No comparable metrics available")
+        
+        # Body weight trend
+        if 'Body Weight (lbs)' in store.week_frame(start_week).columns:
+            st.markdown("### 💪 Body Weight Trend")
+            
+            # Gather body weight data
+            weeks_range = [w for w in available_weeks if start_week <= w <= end_week]
+            bw_series = store.athlete_series(selected_athlete, 'Body Weight (lbs)', weeks=weeks_range).dropna()
+            bw_values = bw_series.tolist()
+            bw_weeks = [f"Week {week}" for week in bw_series.index]
+            
+            if bw_values:
+                fig = cached_figure(
+                    ('weight_trend', selected_athlete, tuple(weeks_range)),
+                    lambda: weight_trend_figure(bw_weeks, bw_values),
+                    weeks=weeks_range
+                )
+                
+                with section("plotly_chart"):
+                    st.plotly_chart(fig, use_container_width=True)
+        
+        # Footer
+        st.markdown("---")
+        st.markdown(f"""
+        <div style="text-align: center; color: #666; font-size: 12px; margin-top: 20px;">
+            <p>Menlo College Athletics • Student-Athlete Health, Wellness & Performance</p>
+            <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,191 @@
+import streamlit as st
+import pandas as pd
+
+from menlo_analytics.metrics import METRICS
+from menlo_charts import cached_figure, group_progress_figure, progress_figure
+from menlo_data import calculate_body_weight_change, get_performance_store
+from menlo_profiling import section
+from menlo_widgets import athlete_picker, athletes_picker
+
+# View -> resample frequency; None plots every session
+PROGRESS_VIEWS = {"Week Number": None, "Each Session": None, "Weekly Average": 'W', "Monthly Average": 'MS'}
+
+store = get_performance_store()
+roster = store.roster
+
+st.header("📈 Individual Progress Tracker")
+
+if not store.weeks:
+    st.warning("⚠️ No weekly data available. Please upload data in the 'Data Input & Roster' tab.")
+else:
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        selected_athlete = athlete_picker(
+            "🔍 Select Athlete",
+            roster,
+            key="progress_athlete",
+            help="Search and select an athlete to view their progress"
+        )
+    
+    with col2:
+        selected_metric = st.selectbox(
+            "📊 Select Metric",
+            options=METRICS,
+            help="Choose which performance metric to track"
+        )
+    
+    # Get athlete's position
+    athlete_position = roster.position(selected_athlete)
+    
+    st.markdown(f"**Position:** {athlete_position}")
+    
+    # Gather data across weeks, or across a date range once sessions have dates
+    weeks = store.weeks
+    span = store.date_span()
+    view, date_range = "Week Number", None
+    if span is not None:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Sessions by date only once every week has one; date views leave undated weeks out
+            all_dated = len(store.session_dates) == len(weeks)
+            view = st.radio("View", list(PROGRESS_VIEWS), index=1 if all_dated else 0, horizontal=True)
+        
+        with col2:
+            date_range = st.date_input(
+                "📅 Date Range",
+                value=(span[0].date(), span[1].date()),
+                min_value=span[0].date(),
+                max_value=span[1].date(),
+                disabled=view == "Week Number"
+            )
+    
+    if view == "Week Number":
+        series = store.athlete_series(selected_athlete, selected_metric).dropna()
+    else:
+        # A range is a single date while the second end is being picked
+        start, end = date_range if len(date_range) == 2 else (date_range[0], span[1])
+        
+        def values_by_date(athletes):
+            """Date x athlete values of the selected metric for this view and range."""
+            if PROGRESS_VIEWS[view] is None:
+                return store.dated_values(selected_metric, athletes, start, end)
+            return store.rollup(selected_metric, PROGRESS_VIEWS[view], athletes, start, end)
+        
+        series = values_by_date([selected_athlete])[selected_athlete].dropna()
+        undated = len(weeks) - len(store.session_dates)
+        if undated:
+            st.caption(f"{undated} week(s) without a session date are only shown in the Week Number view.")
+    values = series.tolist()
+    
+    if not values:
+        st.info(f"ℹ️ No data available for {selected_athlete} - {selected_metric}")
+    else:
+        fig = cached_figure(
+            ('progress', selected_athlete, selected_metric, view, date_range),
+            lambda: progress_figure(selected_athlete, selected_metric, series.index, values)
+        )
+        
+        with section("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Stats summary
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Starting Value", f"{values[0]:.2f}")
+        with col2:
+            st.metric("Current Value", f"{values[-1]:.2f}")
+        with col3:
+            change = values[-1] - values[0]
+            st.metric("Change", f"{change:+.2f}")
+        with col4:
+            pct_change = ((values[-1] - values[0]) / values[0] * 100) if values[0] != 0 else 0
+            st.metric("% Change", f"{pct_change:+.1f}%")
+        
+        # Special handling for Body Weight
+        if selected_metric == "Body Weight (lbs)":
+            st.markdown("---")
+            st.subheader("💪 Body Weight Analysis")
+            
+            if store.has_week(1):
+                latest_week = max(weeks)
+                bw_change = calculate_body_weight_change(selected_athlete, latest_week)
+                
+                if bw_change is not None:
+                    col1, col2 = st.columns(2)
+                    
+                    with col1:
+                        st.metric(
+                            "Body Weight Change from Week 1",
+                            f"{bw_change:+.2f}%",
+                            delta=f"{values[-1] - values[0]:+.1f} lbs"
+                        )
+                    
+                    with col2:
+                        if abs(bw_change) < 2:
+                            status = "✅ Stable"
+                            color = "green"
+                        elif bw_change > 0:
+                            status = "📈 Gaining"
+                            color = "blue"
+                        else:
+                            status = "📉 Losing"
+                            color = "orange"
+                        
+                        st.markdown(f"**Status:** <span style='color:{color}; font-size:18px;'>{status}</span>", unsafe_allow_html=True)
+    
+    # The whole position group as a band, with the selected athlete and any others drawn over it
+    st.markdown("---")
+    st.subheader("👥 Position Group Trends")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        group_position = st.selectbox(
+            "Position Group",
+            options=roster.position_groups,
+            index=roster.position_groups.index(athlete_position) if athlete_position in roster.position_groups else 0
+        )
+        show_all = st.checkbox("Show every athlete in the group", value=True)
+    
+    with col2:
+        highlight = athletes_picker(
+            "🔍 Highlight Athletes",
+            roster,
+            key="group_highlight",
+            help="Drawn over the band alongside the selected athlete"
+        )
+    
+    # By week number, or on the session dates of the view and range picked above
+    highlight_names = list(dict.fromkeys([selected_athlete] + highlight))
+    if view == "Week Number":
+        band = store.position_band(group_position, selected_metric)
+        _, group_names, group_values = store.position_series(group_position, selected_metric)
+        group_weeks = band.index
+        highlighted = {name: store.athlete_series(name, selected_metric).dropna() for name in highlight_names}
+    else:
+        group_names = roster.positions.index[roster.positions == group_position].tolist()
+        group_by_date = values_by_date(group_names)
+        group_weeks, group_values = group_by_date.index, group_by_date.to_numpy(dtype='float32').T
+        band = pd.DataFrame({
+            'mean': group_by_date.mean(axis=1), 'std': group_by_date.std(axis=1), 'count': group_by_date.count(axis=1)
+        })
+        highlighted_by_date = values_by_date(highlight_names)
+        highlighted = {name: highlighted_by_date[name].dropna() for name in highlight_names}
+    
+    if not band['count'].any():
+        st.info(f"ℹ️ No {selected_metric} data for {group_position}")
+    else:
+        fig = cached_figure(
+            ('position progress', group_position, selected_metric, tuple(highlighted), show_all, view, date_range),
+            lambda: group_progress_figure(
+                group_position, selected_metric, group_weeks, group_values, band, highlighted, show_all
+            )
+        )
+        
+        period = "weekly" if view == "Week Number" else "per-date"
+        st.caption(f"{len(group_names)} {group_position} athletes. The band is the {period} mean ± 1 standard deviation.")
+        with section("group plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,123 @@
+import streamlit as st
+import pandas as pd
+
+from menlo_analytics.metrics import METRICS
+from menlo_charts import cached_figure, head_to_head_figure, radar_figure
+from menlo_data import (
+    get_athlete_data_for_week, get_performance_store, get_position_average,
+    get_team_best, normalize_metric,
+)
+from menlo_profiling import section
+from menlo_widgets import athlete_picker, athletes_picker
+
+store = get_performance_store()
+roster = store.roster
+
+st.header("🕸️ Performance Spider Graph")
+
+if not store.weeks:
+    st.warning("⚠️ No weekly data available. Please upload data in the 'Data Input & Roster' tab.")
+else:
+    # Select week for comparison
+    available_weeks = store.weeks
+    selected_week = st.selectbox("📅 Select Week for Comparison", options=available_weeks)
+    
+    # Comparison mode toggle
+    comparison_mode = st.radio(
+        "Comparison Mode",
+        ["Individual vs. Group", "Head-to-Head"],
+        horizontal=True
+    )
+    
+    st.markdown("---")
+    
+    if comparison_mode == "Individual vs. Group":
+        selected_athlete = athlete_picker("🔍 Select Athlete", roster, key="spider_athlete")
+        
+        # Get athlete's position
+        athlete_position = roster.position(selected_athlete)
+        
+        st.markdown(f"**Position:** {athlete_position}")
+        
+        # Get data
+        athlete_data = get_athlete_data_for_week(selected_athlete, selected_week)
+        
+        if athlete_data is None:
+            st.info(f"ℹ️ No data available for {selected_athlete} in Week {selected_week}")
+        else:
+            week_scores = store.week_scores(selected_week)
+            
+            # Prepare data for radar chart
+            categories = []
+            athlete_values = []
+            position_avg_values = []
+            team_best_values = []
+            
+            for metric in METRICS:
+                if metric in athlete_data and not pd.isna(athlete_data[metric]):
+                    categories.append(metric.replace(' (lbs)', '').replace(' (seconds)', '').replace(' (inches)', ''))
+                    
+                    # Normalize values
+                    athlete_norm = week_scores.at[selected_athlete, metric]
+                    athlete_values.append(athlete_norm)
+                    
+                    # Position average
+                    pos_avg = get_position_average(athlete_position, selected_week, metric)
+                    if pos_avg is not None:
+                        pos_avg_norm = normalize_metric(pos_avg, metric, selected_week)
+                        position_avg_values.append(pos_avg_norm)
+                    else:
+                        position_avg_values.append(0)
+                    
+                    # Team best
+                    team_best = get_team_best(selected_week, metric)
+                    if team_best is not None:
+                        team_best_norm = normalize_metric(team_best, metric, selected_week)
+                        team_best_values.append(team_best_norm)
+                    else:
+                        team_best_values.append(0)
+            
+            if not categories:
+                st.info("ℹ️ No metrics available for comparison")
+            else:
+                fig = cached_figure(
+                    ('radar', selected_athlete, selected_week),
+                    lambda: radar_figure(
+                        selected_athlete, athlete_position, selected_week,
+                        categories, athlete_values, position_avg_values, team_best_values
+                    ),
+                    weeks=[selected_week]
+                )
+                
+                with section("plotly_chart"):
+                    st.plotly_chart(fig, use_container_width=True)
+                
+                # Display raw values
+                with st.expander("📊 View Normalized Scores (0-100)"):
+                    comparison_df = pd.DataFrame({
+                        'Metric': categories,
+                        selected_athlete: athlete_values,
+                        f'{athlete_position} Avg': position_avg_values,
+                        'Team Best': team_best_values
+                    })
+                    st.dataframe(comparison_df, use_container_width=True)
+    
+    else:  # Head-to-Head
+        st.markdown("### Select Athletes to Compare (2-4 athletes)")
+        
+        selected_athletes = athletes_picker("🔍 Select Athletes", roster, key="spider_athletes", max_selections=4)
+        
+        if len(selected_athletes) < 2:
+            st.info("ℹ️ Please select at least 2 athletes for head-to-head comparison")
+        else:
+            fig = cached_figure(
+                ('head_to_head', tuple(selected_athletes), selected_week),
+                lambda: head_to_head_figure(selected_athletes, selected_week),
+                weeks=[selected_week]
+            )
+            
+            if fig.data:
+                with section("plotly_chart"):
+                    st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("ℹ️ No comparable data available for selected athletes")
@@ -0,0 +1,304 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Run from anywhere: the app modules live one directory up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_roster, make_season
+from menlo_analytics.database import SeasonDatabase
+from menlo_analytics.ingest import HAS_PYARROW, ingest_week, read_season
+from menlo_analytics.metrics import (
+    METRICS, compute_leaderboard, compute_position_aggregates, compute_week_stats, normalize_values, score_week,
+)
+from menlo_analytics.roster import Roster
+from menlo_analytics.snapshot import export_snapshot, read_snapshot
+from menlo_analytics.store import PerformanceStore
+
+PAGES = [
+    "app_pages/data_input.py",
+    "app_pages/progress_tracker.py",
+    "app_pages/spider_graph.py",
+    "app_pages/player_card.py",
+    "app_pages/leaderboard.py",
+]
+
+# ============================================================================
+# TIMING
+# ============================================================================
+def measure(func, calls):
+    """Run func(*args) for each args tuple in calls; return per-call seconds."""
+    times = []
+    for args in calls:
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+def summarize(suite, athletes, weeks, operation, times):
+    ms = np.array(times) * 1000
+    return {
+        'suite': suite,
+        'athletes': athletes,
+        'weeks': weeks,
+        'operation': operation,
+        'calls': len(ms),
+        'mean_ms': round(float(ms.mean()), 4),
+        'median_ms': round(float(np.median(ms)), 4),
+        'p95_ms': round(float(np.percentile(ms, 95)), 4),
+    }
+
+# ============================================================================
+# CORE OPERATIONS
+# ============================================================================
+def spider_payload(store, athlete_name, week_num):
+    """Everything the Individual vs. Group radar needs: athlete, position average and team best scores."""
+    athlete_data = store.athlete_week(athlete_name, week_num)
+    if athlete_data is None:
+        return None
+    
+    position = store.roster.position(athlete_name)
+    scores = store.week_scores(week_num)
+    stats = store.week_stats(week_num)
+    position_means = store.position_aggregates(week_num)['mean']
+    frame = store.week_frame(week_num)
+    
+    payload = []
+    for metric in athlete_data.index:
+        low, high = stats.at[metric, 'min'], stats.at[metric, 'max']
+        best = frame[metric].min() if "Sprint" in metric else frame[metric].max()
+        payload.append((
+            metric,
+            scores.at[athlete_name, metric],
+            float(normalize_values(position_means.get((position, metric), np.nan), metric, low, high)),
+            float(normalize_values(best, metric, low, high))
+        ))
+    return payload
+
+def bench_core(n_athletes, n_weeks, samples, seed):
+    roster_df = make_roster(n_athletes, seed)
+    season = make_season(roster_df, n_weeks, seed)
+    roster = Roster(roster_df)
+    rng = np.random.default_rng(seed)
+    results = []
+    
+    def record(operation, times):
+        results.append(summarize('core', n_athletes, n_weeks, operation, times))
+    
+    # Loading a season builds the cube plus every week's stats, scores and position aggregates
+    # One session every seven days, so date-range queries have a calendar to work with
+    session_dates = {week_num: pd.Timestamp('2025-01-06') + pd.Timedelta(weeks=week_num - 1) for week_num in season}
+    
+    def build():
+        store = PerformanceStore(roster)
+        store.save_weeks(season, session_dates)
+        return store
+    start = time.perf_counter()
+    store = build()
+    record('build store', [time.perf_counter() - start])
+    
+    weeks = store.weeks
+    names = rng.choice(roster.names, samples)
+    week_picks = rng.choice(weeks, samples)
+    metric_picks = rng.choice(METRICS, samples)
+    frames = [store.week_frame(week_num) for week_num in weeks]
+    
+    record('ingest week', measure(ingest_week, [(season[week_num], roster) for week_num in weeks[:5]]))
+    record('point lookup', measure(store.get, zip(names, week_picks, metric_picks)))
+    record('athlete week', measure(store.athlete_week, zip(names, week_picks)))
+    record('athlete series', measure(store.athlete_series, zip(names, metric_picks)))
+    record('position averages (compute)', measure(compute_position_aggregates, [(frame, roster.positions) for frame in frames]))
+    record('position averages (cached)', measure(store.position_aggregates, [(week_num,) for week_num in week_picks]))
+    record('normalization', measure(lambda frame: score_week(frame, compute_week_stats(frame)), [(frame,) for frame in frames]))
+    record('leaderboard (compute)', measure(
+        compute_leaderboard,
+        [(frames[i], frames[i - 1] if i else None, roster.positions) for i in range(len(frames))]
+    ))
+    for week_num in weeks:
+        store.leaderboard(week_num)
+    record('leaderboard (cached)', measure(store.leaderboard, [(week_num,) for week_num in week_picks]))
+    record('spider payload', measure(lambda name, week_num: spider_payload(store, name, week_num), zip(names, week_picks)))
+    # One grid page sorted by a metric, from anywhere in the season
+    offsets = rng.integers(0, sum(store.record_counts.values()), 50)
+    record('browse page', measure(
+        lambda metric, offset: store.browse(sort_by=metric, descending=True, offset=offset),
+        zip(metric_picks[:50], offsets)
+    ))
+    # Position-group chart data: every athlete's series for one metric
+    record('position series (compute)', measure(
+        lambda position, metric: store.cube.metric_matrix(
+            roster.positions.index[roster.positions == position].map(roster.ids), metric
+        ),
+        zip(rng.choice(roster.position_groups, 20), metric_picks[:20])
+    ))
+    # Picker and roster search: the index is built once per roster, then each keystroke is a lookup
+    start = time.perf_counter()
+    name_index = roster.name_index
+    record('name index build', [time.perf_counter() - start])
+    queries = [name.split(',')[0][:4] for name in names[:100]] + [name.split(' ')[1] for name in names[:100]]
+    record('name search', measure(name_index.search, [(query,) for query in queries]))
+    # Date ranges: binary search over the session timeline, then one cube gather (and a resample)
+    span_days = (n_weeks - 1) * 7
+    range_starts = [pd.Timestamp('2025-01-06') + pd.Timedelta(days=int(day)) for day in rng.integers(0, span_days + 1, 50)]
+    ranges = [(start, start + pd.Timedelta(days=90)) for start in range_starts]
+    record('date range query', measure(
+        lambda name, metric, start, end: store.dated_values(metric, [name], start, end),
+        [(name, metric) + date_range for name, metric, date_range in zip(names, metric_picks, ranges)]
+    ))
+    record('monthly rollup', measure(
+        lambda metric, start, end: store.rollup(metric, 'MS', None, start, end),
+        [(metric,) + date_range for metric, date_range in zip(metric_picks, ranges)]
+    ))
+    # Reading a whole-season device export (one long table split into sessions by its Week column)
+    export = pd.concat([season[week_num].assign(Week=week_num) for week_num in weeks], ignore_index=True)
+    export_files = [('season.csv', export.to_csv(index=False).encode())]
+    if HAS_PYARROW:
+        export_files.append(('season.parquet', export.to_parquet(index=False)))
+    for file_name, file_bytes in export_files:
+        record(f"read {file_name.split('.')[1]} export", measure(read_season, [(file_name, file_bytes)] * 3))
+    # Whole-season snapshot: one columnar file out, and back to validated weeks
+    if HAS_PYARROW:
+        snapshot = export_snapshot(store, 'Bench', '2025')
+        record('export snapshot', measure(export_snapshot, [(store, 'Bench', '2025')] * 3))
+        record('read snapshot', measure(read_snapshot, [(snapshot,)] * 3))
+    # Replacing a week rebuilds only that week's partitions; the rest stay cached
+    record('save week', measure(store.save_week, [(week_num, season[week_num]) for week_num in weeks[:5]]))
+    
+    return results, roster_df, season
+
+# ============================================================================
+# PAGE RERUNS
+# ============================================================================
+def bench_pages(n_athletes, n_weeks, roster_df, season, reruns):
+    """Seed a database and time each page through AppTest in a fresh process (so cold start is real)."""
+    with tempfile.TemporaryDirectory() as workdir:
+        roster_path = os.path.join(workdir, 'roster.csv')
+        db_path = os.path.join(workdir, 'season.db')
+        roster_df.to_csv(roster_path, index=False)
+        database = SeasonDatabase(db_path)
+        database.save_roster(roster_df)
+        PerformanceStore(Roster(roster_df), database=database).save_weeks(season)
+        
+        env = dict(os.environ, MENLO_DB_PATH=db_path, MENLO_ROSTER_PATH=roster_path)
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--pages-worker', '--reruns', str(reruns)],
+            env=env, cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return [summarize('pages', n_athletes, n_weeks, operation, times) for operation, times in timings.items()]
+
+def pages_worker(reruns):
+    """Child process: print {operation: [seconds]} for cold start and each page's first run and reruns."""
+    from streamlit.testing.v1 import AppTest
+    
+    timings = {}
+    at = AppTest.from_file(os.path.join(ROOT, 'menlo_dashboard.py'), default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    timings['cold start'] = [time.perf_counter() - start]
+    
+    for page in PAGES:
+        name = os.path.splitext(os.path.basename(page))[0]
+        at.switch_page(page)
+        start = time.perf_counter()
+        at.run()
+        timings[f'{name} first run'] = [time.perf_counter() - start]
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].message}")
+        
+        times = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+        timings[f'{name} rerun'] = times
+    
+    print(json.dumps(timings))
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline_path, threshold, min_ms):
+    """Print median ratios against a previous results file; return the rows slower than threshold.
+    
+    Operations whose baseline median is under min_ms are shown but never counted,
+    since timer noise dominates at that scale.
+    """
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    key = ['suite', 'athletes', 'weeks', 'operation']
+    merged = pd.DataFrame(results).merge(pd.DataFrame(baseline['results']), on=key, suffixes=('', '_baseline'))
+    merged['ratio'] = merged['median_ms'] / merged['median_ms_baseline']
+    print(f"\nCompared with {baseline_path} (commit {baseline.get('git_commit')}):")
+    print(merged[key + ['median_ms_baseline', 'median_ms', 'ratio']].to_string(index=False, float_format='%.3f'))
+    return merged[(merged['ratio'] > threshold) & (merged['median_ms_baseline'] >= min_ms)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Time core operations and page reruns on synthetic seasons.")
+    parser.add_argument('--athletes', type=int, nargs='+', default=[110, 1000, 10000])
+    parser.add_argument('--weeks', type=int, nargs='+', default=[12, 52])
+    parser.add_argument('--samples', type=int, default=500, help="Random lookups per point/series operation")
+    parser.add_argument('--reruns', type=int, default=5, help="AppTest reruns per page")
+    parser.add_argument('--skip-pages', action='store_true', help="Only time the core operations")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help="Earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25, help="Median ratio counted as a regression")
+    parser.add_argument('--min-ms', type=float, default=0.05, help="Ignore regressions in operations faster than this")
+    parser.add_argument('--pages-worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.pages_worker:
+        pages_worker(args.reruns)
+        return
+    
+    results = []
+    for n_athletes in args.athletes:
+        for n_weeks in args.weeks:
+            print(f"{n_athletes} athletes x {n_weeks} weeks...", flush=True)
+            core_results, roster_df, season = bench_core(n_athletes, n_weeks, args.samples, args.seed)
+            results.extend(core_results)
+            if not args.skip_pages:
+                results.extend(bench_pages(n_athletes, n_weeks, roster_df, season, args.reruns))
+    
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'versions': {'numpy': np.__version__, 'pandas': pd.__version__},
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    
+    print(pd.DataFrame(results)[['suite', 'athletes', 'weeks', 'operation', 'calls', 'median_ms', 'p95_ms']]
+          .to_string(index=False, float_format='%.3f'))
+    print(f"\nWrote {args.output}")
+    
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold, args.min_ms)
+        if len(regressions):
+            print(f"\n{len(regressions)} operation(s) slower than {args.threshold:.2f}x the baseline")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
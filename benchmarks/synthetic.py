@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from menlo_analytics.metrics import METRICS
+
+# ============================================================================
+# SYNTHETIC ROSTERS AND SEASONS
+# ============================================================================
+# Position baselines (mean, spread) roughly matching a college football roster
+POSITION_PROFILES = {
+    "Line": {
+        "Body Weight (lbs)": (285, 25), "Bench Press (lbs)": (300, 40), "Back Squat (lbs)": (420, 60),
+        "Hex Bar Deadlift (lbs)": (500, 60), "Flying 10 Sprint (seconds)": (1.25, 0.06),
+        "Vertical Jump (inches)": (24, 4), "Power Clean (lbs)": (250, 30)
+    },
+    "Big Skill": {
+        "Body Weight (lbs)": (225, 18), "Bench Press (lbs)": (260, 35), "Back Squat (lbs)": (360, 50),
+        "Hex Bar Deadlift (lbs)": (440, 55), "Flying 10 Sprint (seconds)": (1.15, 0.05),
+        "Vertical Jump (inches)": (28, 4), "Power Clean (lbs)": (240, 30)
+    },
+    "Skill": {
+        "Body Weight (lbs)": (185, 15), "Bench Press (lbs)": (220, 30), "Back Squat (lbs)": (310, 45),
+        "Hex Bar Deadlift (lbs)": (380, 50), "Flying 10 Sprint (seconds)": (1.05, 0.05),
+        "Vertical Jump (inches)": (31, 4), "Power Clean (lbs)": (220, 25)
+    }
+}
+
+# Average change per week: strength climbs, sprint times drop, body weight drifts
+WEEKLY_TREND = {
+    "Body Weight (lbs)": 0.001, "Bench Press (lbs)": 0.005, "Back Squat (lbs)": 0.006,
+    "Hex Bar Deadlift (lbs)": 0.006, "Flying 10 Sprint (seconds)": -0.002,
+    "Vertical Jump (inches)": 0.002, "Power Clean (lbs)": 0.005
+}
+
+LAST_NAMES = [
+    "Alvarez", "Barklow", "Chen", "Diaz", "Edwards", "Fonoti", "Garcia", "Harris", "Ibarra", "Johnson",
+    "Kealoha", "Lopez", "Martinez", "Nguyen", "Ortiz", "Perez", "Quinn", "Reyes", "Smith", "Tuilagi",
+    "Usman", "Vargas", "Williams", "Xiong", "Young", "Zamora"
+]
+FIRST_NAMES = [
+    "Aaron", "Brandon", "Carlos", "Daniel", "Elijah", "Fernando", "Gabriel", "Hunter", "Isaiah", "Jacob",
+    "Kai", "Luis", "Marcus", "Noah", "Owen", "Pedro", "Ryan", "Samuel", "Tyler", "Victor", "Xavier", "Zion"
+]
+
+def make_roster(n_athletes, seed=0):
+    """Athlete ID/Name/Position roster with unique 'Last, First' names, about 40% Line, 25% Big Skill, 35% Skill."""
+    rng = np.random.default_rng(seed)
+    last = rng.choice(LAST_NAMES, n_athletes)
+    first = rng.choice(FIRST_NAMES, n_athletes)
+    return pd.DataFrame({
+        'Athlete ID': np.arange(1, n_athletes + 1),
+        'Name': [f"{l}, {f} {i}" for i, (l, f) in enumerate(zip(last, first), start=1)],
+        'Position': rng.choice(list(POSITION_PROFILES), n_athletes, p=[0.4, 0.25, 0.35])
+    })
+
+def make_season(roster_df, n_weeks, seed=0, absent_rate=0.08, untested_rate=0.10, skipped_metric_rate=0.05):
+    """{week: upload-shaped DataFrame} with realistic gaps.
+    
+    Each week some athletes are absent (no row), some cells are untested (blank),
+    and occasionally a metric is not tested that week at all.
+    """
+    rng = np.random.default_rng(seed)
+    n_athletes = len(roster_df)
+    positions = roster_df['Position'].to_numpy()
+    
+    # Each athlete keeps a personal baseline and weekly rate for the whole season
+    baselines = np.empty((n_athletes, len(METRICS)))
+    for j, metric in enumerate(METRICS):
+        means = np.array([POSITION_PROFILES[pos][metric][0] for pos in positions])
+        spreads = np.array([POSITION_PROFILES[pos][metric][1] for pos in positions])
+        baselines[:, j] = rng.normal(means, spreads)
+    rates = np.array([WEEKLY_TREND[m] for m in METRICS]) * rng.uniform(0.2, 1.8, (n_athletes, len(METRICS)))
+    
+    season = {}
+    for week_num in range(1, n_weeks + 1):
+        noise = rng.normal(0, 0.015, (n_athletes, len(METRICS)))
+        values = baselines * (1 + rates * (week_num - 1) + noise)
+        values[rng.random(values.shape) < untested_rate] = np.nan
+        values[:, rng.random(len(METRICS)) < skipped_metric_rate] = np.nan
+        
+        week_df = pd.DataFrame(values, columns=METRICS)
+        week_df = week_df.round({metric: 2 if "Sprint" in metric else 1 for metric in METRICS})
+        week_df.insert(0, 'Name', roster_df['Name'].to_numpy())
+        present = rng.random(n_athletes) >= absent_rate
+        season[week_num] = week_df[present].reset_index(drop=True)
+    
+    return season
@@ -0,0 +1,4 @@
+# Headless analytics for the Menlo dashboard: roster, season store, ingest and
+# reports with no Streamlit dependency. Import the submodules directly
+# (menlo_analytics.store, .reports, ...); nothing is imported here so that
+# card-rendering worker processes, which only need .cards, start quickly.
@@ -0,0 +1,122 @@
+import html
+
+from .search import normalize_name
+
+# Optional: PDF output when WeasyPrint is installed
+try:
+    from weasyprint import HTML
+except ImportError:
+    HTML = None
+
+# ============================================================================
+# PLAYER CARD RENDERING
+# ============================================================================
+# Kept free of Streamlit and pandas so batch export workers start quickly.
+
+CARD_CSS = """
+    @page { size: letter; margin: 0.5in; }
+    body { font-family: Helvetica, Arial, sans-serif; color: #222; margin: 0; }
+    .card-header {
+        background: linear-gradient(135deg, #002855 0%, #003366 100%);
+        color: white;
+        padding: 30px;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    }
+    .card-header h1 { color: white; margin: 0; }
+    .card-header .position { font-size: 20px; color: #F3C363; margin: 5px 0; }
+    .card-header .range { font-size: 16px; margin: 5px 0; }
+    h3 { color: #002855; }
+    table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
+    th { background-color: #002855; color: white; text-align: left; padding: 8px; }
+    td { border-bottom: 1px solid #E5E5E5; padding: 8px; }
+    .footer { text-align: center; color: #666; font-size: 12px; margin-top: 20px; }
+"""
+
+def card_filename(athlete_name, athlete_id, extension):
+    """File name for an athlete's card, e.g. lopez_tomas_12.html; the Athlete ID keeps namesakes apart."""
+    return f"{normalize_name(athlete_name).replace(' ', '_')}_{athlete_id}.{extension}"
+
+def render_weight_chart_svg(weeks, weights, width=640, height=240):
+    """Body weight trend as a self-contained SVG line chart (no JavaScript needed to view or print)."""
+    pad_left, pad_right, pad_top, pad_bottom = 50, 20, 20, 40
+    plot_width = width - pad_left - pad_right
+    plot_height = height - pad_top - pad_bottom
+    
+    low, high = min(weights), max(weights)
+    if high == low:
+        low, high = low - 1, high + 1
+    
+    def x_pos(i):
+        return pad_left + (plot_width * i / (len(weights) - 1) if len(weights) > 1 else plot_width / 2)
+    
+    def y_pos(value):
+        return pad_top + plot_height * (high - value) / (high - low)
+    
+    points = " ".join(f"{x_pos(i):.1f},{y_pos(w):.1f}" for i, w in enumerate(weights))
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">']
+    
+    for value in (low, (low + high) / 2, high):
+        y = y_pos(value)
+        parts.append(f'<line x1="{pad_left}" y1="{y:.1f}" x2="{width - pad_right}" y2="{y:.1f}" stroke="#E5E5E5"/>')
+        parts.append(f'<text x="{pad_left - 6}" y="{y + 4:.1f}" font-size="11" text-anchor="end" fill="#666">{value:.1f}</text>')
+    
+    parts.append(f'<polyline points="{points}" fill="none" stroke="#002855" stroke-width="2"/>')
+    for i, (week, weight) in enumerate(zip(weeks, weights)):
+        parts.append(f'<circle cx="{x_pos(i):.1f}" cy="{y_pos(weight):.1f}" r="5" fill="#F3C363" stroke="#002855" stroke-width="1.5"/>')
+        parts.append(f'<text x="{x_pos(i):.1f}" y="{height - pad_bottom + 18}" font-size="11" text-anchor="middle" fill="#666">Week {week}</text>')
+    
+    parts.append('</svg>')
+    return "".join(parts)
+
+def render_card_html(card):
+    """Full standalone HTML page for one athlete's Player Card payload."""
+    name = html.escape(card['name'])
+    start_week, end_week = card['start_week'], card['end_week']
+    
+    body = [f"""
+    <div class="card-header">
+        <h1>{name}</h1>
+        <p class="position">Position: {html.escape(card['position'])}</p>
+        <p class="range">Performance Report: Week {start_week} to Week {end_week}</p>
+    </div>
+    """]
+    
+    if card['current_weight'] is not None:
+        body.append(f"<p><strong>Current Weight (Week {end_week}):</strong> {card['current_weight']:g} lbs</p>")
+    
+    body.append("<h3>📊 Performance Metrics</h3>")
+    if card['progress']:
+        columns = list(card['progress'][0])
+        header = "".join(f"<th>{html.escape(col)}</th>" for col in columns)
+        rows = "".join(
+            "<tr>" + "".join(f"<td>{html.escape(str(row[col]))}</td>" for col in columns) + "</tr>"
+            for row in card['progress']
+        )
+        body.append(f"<table><thead><tr>{header}</tr></thead><tbody>{rows}</tbody></table>")
+    else:
+        body.append("<p>No comparable metrics available</p>")
+    
+    if card['weight_weeks']:
+        body.append("<h3>💪 Body Weight Trend</h3>")
+        body.append(render_weight_chart_svg(card['weight_weeks'], card['weight_values']))
+    
+    body.append(f"""
+    <div class="footer">
+        <p>Menlo College Athletics • Student-Athlete Health, Wellness & Performance</p>
+        <p>Generated on {html.escape(card['generated_on'])}</p>
+    </div>
+    """)
+    
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{name} - Player Card</title>'
+        f'<style>{CARD_CSS}</style></head><body>{"".join(body)}</body></html>'
+    )
+
+def render_card_files(card, include_pdf=False):
+    """Render one card to [(file name, bytes)]; runs inside batch export worker processes."""
+    card_html = render_card_html(card)
+    files = [(card_filename(card['name'], card['athlete_id'], 'html'), card_html.encode('utf-8'))]
+    if include_pdf and HTML is not None:
+        files.append((card_filename(card['name'], card['athlete_id'], 'pdf'), HTML(string=card_html).write_pdf()))
+    return files
@@ -0,0 +1,209 @@
+import argparse
+import os
+import sys
+
+from . import profiling
+from .cards import HTML
+from .config import DB_PATH, DEFAULT_TEAM, ROSTER_PATH
+from .database import SeasonDatabase
+from .ingest import read_folder, read_season, validate_season_upload
+from .reports import athlete_flags, build_player_cards, export_player_cards, week_summary
+from .roster import load_roster
+from .snapshot import export_snapshot, read_snapshot, restore_snapshot
+from .store import PerformanceStore
+
+# ============================================================================
+# COMMANDS
+# ============================================================================
+def open_store(args):
+    database = SeasonDatabase(args.db, args.team, args.season)
+    roster_path = args.roster
+    if roster_path is None and database.is_default_partition():
+        roster_path = ROSTER_PATH
+    return PerformanceStore(load_roster(roster_path, database), database=database)
+
+def roster(args):
+    """Save a roster, and optionally its position groups, for --team and --season."""
+    if not os.path.isfile(args.file):
+        print(f"No roster file at {args.file}", file=sys.stderr)
+        return 1
+    database = SeasonDatabase(args.db, args.team, args.season)
+    saved = load_roster(args.file, database, args.positions)
+    print(
+        f"Saved {len(saved)} athletes for {args.team} {args.season}; "
+        f"position groups: {', '.join(saved.position_groups)}"
+    )
+    return 0
+
+def describe_week(week_num, n_records, session_dates):
+    """'3 (2025-08-14, 110 records)' for ingest output; the date is left out for undated weeks."""
+    date = session_dates.get(week_num)
+    return f"{week_num} ({'' if date is None else f'{date:%Y-%m-%d}, '}{n_records} records)"
+
+def ingest(args, store):
+    """Validate a folder, workbook or ZIP of weekly files and save every week in one transaction."""
+    if os.path.isdir(args.source):
+        frames = read_folder(args.source)
+    else:
+        with open(args.source, 'rb') as f:
+            frames = read_season(os.path.basename(args.source), f.read())
+    
+    week_dfs, session_dates, problems, issues_df = validate_season_upload(
+        frames, store.roster, store.session_dates, max(store.weeks, default=0) + 1
+    )
+    if problems:
+        print("Nothing was saved:", *(f"  - {problem}" for problem in problems), sep='\n', file=sys.stderr)
+        return 1
+    
+    if not issues_df.empty:
+        print(f"{len(issues_df)} row/cell problems (unmatched rows skipped, non-numeric cells saved as blank)")
+        if args.issues:
+            issues_df.to_csv(args.issues, index=False)
+            print(f"  details: {args.issues}")
+    
+    weeks_text = ', '.join(describe_week(week, len(df), session_dates) for week, df in week_dfs.items())
+    if args.dry_run:
+        print(f"Dry run: would save Weeks {weeks_text}")
+        return 0
+    
+    store.save_weeks(week_dfs, session_dates)
+    print(f"Saved Weeks {weeks_text} to {args.db}")
+    return 0
+
+def report(args, store):
+    """Write summary, leaderboard and flag CSVs per week, plus an optional ZIP of Player Cards."""
+    if not store.weeks:
+        print(f"No saved weeks for {args.team} {args.season} in {args.db}", file=sys.stderr)
+        return 1
+    
+    weeks = args.week or [store.weeks[-1]]
+    unknown = [week for week in weeks if not store.has_week(week)]
+    if unknown:
+        print(f"Not saved: Week {', '.join(map(str, unknown))}", file=sys.stderr)
+        return 1
+    
+    os.makedirs(args.out, exist_ok=True)
+    written = []
+    for week_num in weeks:
+        outputs = {
+            'summary': week_summary(store, week_num),
+            'leaderboard': store.leaderboard(week_num).reset_index(),
+            'flags': athlete_flags(store, week_num, args.weight_change, args.drop)
+        }
+        for kind, frame in outputs.items():
+            path = os.path.join(args.out, f"week{week_num}_{kind}.csv")
+            frame.to_csv(path, index=False, float_format='%.4g')
+            written.append(path)
+    
+    if args.cards:
+        start_week, end_week = store.weeks[0], max(weeks)
+        cards = build_player_cards(store, start_week, end_week)
+        path = os.path.join(args.out, f"menlo_player_cards_week{start_week}-{end_week}.zip")
+        with open(path, 'wb') as f:
+            f.write(export_player_cards(cards, include_pdf=args.pdf and HTML is not None))
+        written.append(path)
+    
+    print("Wrote:", *(f"  {path}" for path in written), sep='\n')
+    return 0
+
+def nightly(args, store):
+    """Ingest the weekly files, then report on the latest week with Player Cards."""
+    status = ingest(args, store)
+    if status or args.dry_run:
+        return status
+    return report(args, store)
+
+def export(args, store):
+    """Write the roster, every saved week and its scores to one Parquet (or .arrow/.feather) file."""
+    fmt = 'arrow' if args.file.lower().endswith(('.arrow', '.feather')) else 'parquet'
+    try:
+        data = export_snapshot(store, args.team, args.season, fmt)
+    except ImportError as e:
+        print(e, file=sys.stderr)
+        return 1
+    with open(args.file, 'wb') as f:
+        f.write(data)
+    print(f"Wrote {len(store.roster)} athletes and {len(store.weeks)} weeks to {args.file} ({len(data) // 1024} KB)")
+    return 0
+
+def restore(args):
+    """Load an export into --team and --season: its roster and position groups replace theirs, and its weeks are saved."""
+    with open(args.file, 'rb') as f:
+        try:
+            roster, week_dfs, session_dates, info = read_snapshot(f.read())
+        except (ImportError, ValueError) as e:
+            print(e, file=sys.stderr)
+            return 1
+    store = PerformanceStore(roster, database=SeasonDatabase(args.db, args.team, args.season))
+    restore_snapshot(store, roster, week_dfs, session_dates)
+    weeks_text = ', '.join(describe_week(week, len(df), session_dates) for week, df in week_dfs.items())
+    print(
+        f"Restored {info['team']} {info['season']} as {args.team} {args.season}: "
+        f"{len(roster)} athletes, Weeks {weeks_text or 'none'}"
+    )
+    return 0
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m menlo_analytics",
+        description="Ingest weekly performance files and produce reports without the dashboard."
+    )
+    parser.add_argument('--db', default=DB_PATH, help=f"SQLite season file (default {DB_PATH}, or MENLO_DB_PATH)")
+    parser.add_argument('--team', default=DEFAULT_TEAM, help=f"Team (default {DEFAULT_TEAM}, or MENLO_TEAM)")
+    parser.add_argument('--season', help="Season (default MENLO_SEASON, else the team's latest saved season)")
+    parser.add_argument(
+        '--roster',
+        help="Roster CSV to load and save (default: roster.csv for the default team and season, else the saved roster)"
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    roster_parser = commands.add_parser('roster', help=roster.__doc__)
+    roster_parser.add_argument('file', help="CSV with Athlete ID, Name and Position columns")
+    roster_parser.add_argument('--positions', nargs='+', help="Position groups in display order (default: roster order)")
+    
+    def add_ingest_args(command):
+        command.add_argument('source', help="Folder of weekly CSV/XLSX files, a workbook with one sheet per week, or a ZIP")
+        command.add_argument('--issues', help="Write row/cell problems to this CSV")
+        command.add_argument('--dry-run', action='store_true', help="Validate only; save nothing")
+    
+    def add_report_args(command, cards_default):
+        command.add_argument('--out', required=True, help="Folder for the report files")
+        command.add_argument('--week', type=int, nargs='+', help="Weeks to report (default: latest saved)")
+        command.add_argument('--weight-change', type=float, default=5.0, help="Flag body weight moves above this %% since Week 1")
+        command.add_argument('--drop', type=float, default=10.0, help="Flag metrics this %% worse than the previous week")
+        command.add_argument('--cards', action='store_true', default=cards_default, help="Also export Player Cards as a ZIP")
+        command.add_argument('--pdf', action='store_true', help="Include PDF cards (needs WeasyPrint)")
+    
+    export_parser = commands.add_parser('export', help=export.__doc__)
+    export_parser.add_argument('file', help="Output file: .parquet, or .arrow/.feather for the Arrow format")
+    import_parser = commands.add_parser('import', help=restore.__doc__)
+    import_parser.add_argument('file', help="A file written by export or the dashboard's season export")
+    
+    add_ingest_args(commands.add_parser('ingest', help=ingest.__doc__))
+    add_report_args(commands.add_parser('report', help=report.__doc__), cards_default=False)
+    nightly_parser = commands.add_parser('nightly', help=nightly.__doc__)
+    add_ingest_args(nightly_parser)
+    add_report_args(nightly_parser, cards_default=True)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.season is None:
+        args.season = SeasonDatabase(args.db, args.team).season
+    profiling.start_run()
+    if args.command == 'roster':
+        status = roster(args)
+    elif args.command == 'import':
+        status = restore(args)
+    else:
+        try:
+            store = open_store(args)
+        except FileNotFoundError as e:
+            print(e, file=sys.stderr)
+            return 1
+        status = {'ingest': ingest, 'report': report, 'nightly': nightly, 'export': export}[args.command](args, store)
+    profiling.finish_run(f"cli {args.command}")
+    return status
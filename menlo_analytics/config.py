@@ -0,0 +1,22 @@
+import os
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Shared by the dashboard and the command line, so both read and write the same season
+
+# SQLite file that keeps saved weeks across restarts and redeploys
+DB_PATH = os.environ.get("MENLO_DB_PATH", "menlo_performance.db")
+
+# Team and season opened by default; data saved before seasons existed is filed under them.
+# MENLO_SEASON pins the season; unset, it is the team's latest saved season (see
+# SeasonDatabase.default_season), so it does not change on January 1.
+DEFAULT_TEAM = os.environ.get("MENLO_TEAM", "Football")
+DEFAULT_SEASON = os.environ.get("MENLO_SEASON")
+
+# Roster CSV for the default team and season, with Athlete ID, Name and Position columns;
+# the database keeps a copy of the last one loaded. Other teams' rosters are saved with the CLI.
+ROSTER_PATH = os.environ.get(
+    "MENLO_ROSTER_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "roster.csv")
+)
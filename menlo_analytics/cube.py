@@ -0,0 +1,100 @@
+import pandas as pd
+import numpy as np
+
+# ============================================================================
+# SEASON CUBE
+# ============================================================================
+class SeasonCube:
+    """Dense athletes x weeks x metrics float32 array, NaN where nothing was recorded.
+    
+    Athletes are keyed by Athlete ID; names are the roster's business, so a
+    corrected spelling does not move any values. Week slots are appended in arrival order and never move, so a slot looked up
+    by one session stays valid while another session adds a week. `sorted_slots`
+    orders the slots by week number for time series.
+    """
+    
+    def __init__(self, athletes, metrics, week_capacity=16):
+        self.athletes = pd.Index(athletes)
+        self.metrics = pd.Index(metrics)
+        self.week_slots = {}
+        self.sorted_weeks = []
+        self.sorted_slots = np.array([], dtype=np.intp)
+        self.values = np.full((len(self.athletes), week_capacity, len(self.metrics)), np.nan, dtype='float32')
+    
+    def set_week(self, week_num, frame):
+        """Write one week's Athlete ID x Metric frame into its slot; other weeks are untouched."""
+        week_values = np.full((len(self.athletes), len(self.metrics)), np.nan, dtype='float32')
+        rows = self.athletes.get_indexer(frame.index)
+        cols = self.metrics.get_indexer(frame.columns)
+        known_rows, known_cols = rows >= 0, cols >= 0
+        week_values[np.ix_(rows[known_rows], cols[known_cols])] = \
+            frame.to_numpy(dtype='float32')[np.ix_(known_rows, known_cols)]
+        
+        slot = self.week_slots.get(week_num)
+        if slot is None:
+            slot = len(self.week_slots)
+            if slot == self.values.shape[1]:
+                grown = np.full((self.values.shape[0], slot * 2, self.values.shape[2]), np.nan, dtype='float32')
+                grown[:, :slot] = self.values
+                self.values = grown
+            self.values[:, slot] = week_values
+            self.week_slots[week_num] = slot
+            self.sorted_weeks = sorted(self.week_slots)
+            self.sorted_slots = np.array([self.week_slots[week] for week in self.sorted_weeks], dtype=np.intp)
+        else:
+            self.values[:, slot] = week_values
+    
+    def set_athletes(self, athletes):
+        """Re-align the athlete axis to a new roster, keeping rows for athletes on both."""
+        athletes = pd.Index(athletes)
+        values = np.full((len(athletes), self.values.shape[1], len(self.metrics)), np.nan, dtype='float32')
+        rows = self.athletes.get_indexer(athletes)
+        values[rows >= 0] = self.values[rows[rows >= 0]]
+        self.athletes, self.values = athletes, values
+    
+    def week_slice(self, week_num):
+        """Athletes x metrics view of one week."""
+        return self.values[:, self.week_slots[week_num]]
+    
+    def week_frame(self, week_num):
+        """One week as an Athlete ID x Metric DataFrame, without athletes or metrics that have no values."""
+        frame = pd.DataFrame(self.week_slice(week_num), index=self.athletes, columns=self.metrics)
+        frame = frame.dropna(how='all').dropna(axis=1, how='all')
+        return frame.rename_axis(index='Athlete ID', columns='Metric')
+    
+    def value(self, athlete_id, week_num, metric):
+        """Single value, or NaN if the athlete, week or metric is unknown."""
+        slot = self.week_slots.get(week_num)
+        if slot is None or athlete_id not in self.athletes or metric not in self.metrics:
+            return np.nan
+        return self.values[self.athletes.get_loc(athlete_id), slot, self.metrics.get_loc(metric)]
+    
+    def athlete_week(self, athlete_id, week_num):
+        """Metric values for one athlete in one week (a view), or None."""
+        slot = self.week_slots.get(week_num)
+        if slot is None or athlete_id not in self.athletes:
+            return None
+        return self.values[self.athletes.get_loc(athlete_id), slot]
+    
+    def athlete_series(self, athlete_id, metric):
+        """(weeks, values) of one metric for one athlete, ordered by week."""
+        if athlete_id not in self.athletes or metric not in self.metrics:
+            return self.sorted_weeks, np.full(len(self.sorted_weeks), np.nan, dtype='float32')
+        athlete_values = self.values[self.athletes.get_loc(athlete_id), :, self.metrics.get_loc(metric)]
+        return self.sorted_weeks, athlete_values[self.sorted_slots]
+    
+    def metric_matrix(self, athlete_ids, metric, weeks=None):
+        """(weeks, athletes x weeks values) of one metric for several athletes; unknown IDs are NaN rows.
+        
+        Weeks come in week order, or in the order given (each must have a slot).
+        """
+        if weeks is None:
+            weeks, slots = self.sorted_weeks, self.sorted_slots
+        else:
+            slots = np.array([self.week_slots[week_num] for week_num in weeks], dtype=np.intp)
+        rows = self.athletes.get_indexer(athlete_ids)
+        values = np.full((len(rows), len(weeks)), np.nan, dtype='float32')
+        if metric in self.metrics:
+            known = rows >= 0
+            values[known] = self.values[rows[known][:, None], slots, self.metrics.get_loc(metric)]
+        return weeks, values
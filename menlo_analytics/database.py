@@ -0,0 +1,377 @@
+import pandas as pd
+from datetime import datetime
+from contextlib import closing
+import json
+import sqlite3
+
+from .config import DEFAULT_SEASON, DEFAULT_TEAM
+from .profiling import timed
+
+# ============================================================================
+# SEASON DATABASE
+# ============================================================================
+class SeasonDatabase:
+    """SQLite file holding every saved week, so a season survives restarts.
+    
+    One file holds every team and season. An instance is scoped to one
+    (team, season) partition, and every query leads with those key columns, so
+    its cost does not grow with the other partitions in the file. A week is one
+    testing session: its number orders the season and its optional session_date
+    (ISO date) places it on the calendar. Values are keyed by Athlete ID, so a
+    name corrected on the roster keeps its history.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS weeks (
+            team TEXT NOT NULL,
+            season TEXT NOT NULL,
+            week INTEGER NOT NULL,
+            record_count INTEGER NOT NULL,
+            saved_at TEXT NOT NULL,
+            session_date TEXT,
+            PRIMARY KEY (team, season, week)
+        );
+        CREATE TABLE IF NOT EXISTS performance (
+            team TEXT NOT NULL,
+            season TEXT NOT NULL,
+            week INTEGER NOT NULL,
+            athlete_id INTEGER NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL,
+            PRIMARY KEY (team, season, week, athlete_id, metric)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_performance_athlete
+            ON performance (team, season, athlete_id, metric, week);
+        CREATE TABLE IF NOT EXISTS unmatched_performance (
+            team TEXT NOT NULL,
+            season TEXT NOT NULL,
+            week INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL,
+            PRIMARY KEY (team, season, week, name, metric)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS roster (
+            team TEXT NOT NULL,
+            season TEXT NOT NULL,
+            athlete_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            position TEXT NOT NULL,
+            PRIMARY KEY (team, season, athlete_id),
+            UNIQUE (team, season, name)
+        );
+        CREATE TABLE IF NOT EXISTS teams (
+            team TEXT PRIMARY KEY,
+            position_groups TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS roster_stamps (
+            team TEXT NOT NULL,
+            season TEXT NOT NULL,
+            saved_at TEXT NOT NULL,
+            PRIMARY KEY (team, season)
+        );
+    """
+    
+    LEGACY_TABLES = ('weeks', 'performance', 'roster')
+    
+    def __init__(self, path, team=DEFAULT_TEAM, season=None):
+        self.path = path
+        self.team = team
+        with closing(self._connect()) as conn:
+            self._key_performance_by_id(conn)
+            self._migrate(conn)
+            conn.executescript(self.SCHEMA)
+            self._add_session_dates(conn)
+            with conn:
+                self._match_unmatched(conn)
+        self.season = self.default_season(team) if season is None else str(season)
+    
+    def _connect(self):
+        # A short-lived connection per call keeps this safe across Streamlit's script threads
+        return sqlite3.connect(self.path)
+    
+    @staticmethod
+    def _table_columns(conn, table):
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    
+    @staticmethod
+    def _run_schema(conn):
+        # Statement by statement: executescript() would commit the caller's transaction
+        for statement in SeasonDatabase.SCHEMA.split(';'):
+            if statement.strip():
+                conn.execute(statement)
+    
+    @staticmethod
+    def _key_performance_by_id(conn):
+        """Move values saved by name (files from before Athlete IDs were stored) to unmatched_performance.
+        
+        _match_unmatched() then keys them by the Athlete ID of the same name on the
+        saved roster; rows with no roster match wait there for a roster that has them.
+        One transaction, so a failure leaves the file as it was.
+        """
+        columns = SeasonDatabase._table_columns(conn, 'performance')
+        if 'team' not in columns or 'name' not in columns:
+            return
+        
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DROP INDEX IF EXISTS idx_performance_athlete")
+            conn.execute("ALTER TABLE performance RENAME TO performance_by_name")
+            SeasonDatabase._run_schema(conn)
+            conn.execute(
+                "INSERT OR IGNORE INTO unmatched_performance (team, season, week, name, metric, value) "
+                "SELECT team, season, week, name, metric, value FROM performance_by_name"
+            )
+            conn.execute("DROP TABLE performance_by_name")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    @staticmethod
+    def _match_unmatched(conn, team=None, season=None):
+        """Key unmatched_performance rows whose name is on their partition's saved roster by its Athlete ID.
+        
+        Values already saved by ID are newer and are kept. Runs in the caller's
+        transaction; pass team and season to match one partition only.
+        """
+        where, params = ("AND u.team = ? AND u.season = ?", (team, season)) if team is not None else ("", ())
+        conn.execute(
+            "INSERT OR IGNORE INTO performance (team, season, week, athlete_id, metric, value) "
+            "SELECT u.team, u.season, u.week, r.athlete_id, u.metric, u.value FROM unmatched_performance u "
+            f"JOIN roster r ON r.team = u.team AND r.season = u.season AND r.name = u.name WHERE 1 {where}",
+            params
+        )
+        conn.execute(
+            "DELETE FROM unmatched_performance AS u WHERE EXISTS (SELECT 1 FROM roster r "
+            f"WHERE r.team = u.team AND r.season = u.season AND r.name = u.name) {where}",
+            params
+        )
+    
+    @staticmethod
+    def _migrate(conn):
+        """Move a single-season file (tables without team/season) under the default team and one season.
+        
+        Files from before the roster table only have weeks and performance; only the
+        tables present are copied. Values were saved by name and go to
+        unmatched_performance, to be keyed by ID once a roster is saved (see
+        _key_performance_by_id). Everything runs in one transaction, so a failure
+        leaves the file as it was. `*_single_season` tables left by an earlier,
+        interrupted migration are picked up and finished.
+        """
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        legacy = [
+            table for table in SeasonDatabase.LEGACY_TABLES
+            if f"{table}_single_season" in tables
+            or (table in tables and 'team' not in SeasonDatabase._table_columns(conn, table))
+        ]
+        if not legacy:
+            return
+        
+        conn.execute("BEGIN")
+        try:
+            for table in legacy:
+                if f"{table}_single_season" not in tables:
+                    if table == 'performance':
+                        conn.execute("DROP INDEX IF EXISTS idx_performance_athlete")
+                    conn.execute(f"ALTER TABLE {table} RENAME TO {table}_single_season")
+            SeasonDatabase._run_schema(conn)
+            if 'session_date' not in SeasonDatabase._table_columns(conn, 'weeks'):
+                conn.execute("ALTER TABLE weeks ADD COLUMN session_date TEXT")
+            
+            # The season is the year the data was first saved, not the year the file happens to be opened
+            first_saved = None
+            if 'weeks' in legacy:
+                first_saved = conn.execute("SELECT MIN(saved_at) FROM weeks_single_season").fetchone()[0]
+            key = (DEFAULT_TEAM, DEFAULT_SEASON or (first_saved or datetime.now().isoformat())[:4])
+            # OR IGNORE: rows saved into the new tables after an interrupted migration are newer and win
+            copies = {
+                'weeks': "INSERT OR IGNORE INTO weeks (team, season, week, record_count, saved_at) "
+                         "SELECT ?, ?, week, record_count, saved_at FROM weeks_single_season",
+                'performance': "INSERT OR IGNORE INTO unmatched_performance (team, season, week, name, metric, value) "
+                               "SELECT ?, ?, week, name, metric, value FROM performance_single_season",
+                'roster': "INSERT OR IGNORE INTO roster (team, season, athlete_id, name, position) "
+                          "SELECT ?, ?, athlete_id, name, position FROM roster_single_season",
+            }
+            for table in legacy:
+                conn.execute(copies[table], key)
+                conn.execute(f"DROP TABLE {table}_single_season")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def default_season(self, team):
+        """MENLO_SEASON if set, else the team's latest saved season, else the current year for a new team.
+        
+        Following the saved data keeps the default from jumping to an empty season on
+        January 1, and keeps the dashboard and the nightly CLI on the same season.
+        """
+        if DEFAULT_SEASON is not None:
+            return DEFAULT_SEASON
+        with closing(self._connect()) as conn:
+            latest = conn.execute(
+                "SELECT MAX(season) FROM (SELECT season FROM roster WHERE team = ? UNION SELECT season FROM weeks WHERE team = ?)",
+                (team, team)
+            ).fetchone()[0]
+        return latest or str(datetime.now().year)
+    
+    def is_default_partition(self):
+        """True for the default team's default season, the partition roster.csv belongs to."""
+        return self.team == DEFAULT_TEAM and self.season == self.default_season(DEFAULT_TEAM)
+    
+    @staticmethod
+    def _add_session_dates(conn):
+        """Add the session_date column to files saved before sessions had dates; their weeks stay undated."""
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(weeks)")]
+        if 'session_date' not in columns:
+            with conn:
+                conn.execute("ALTER TABLE weeks ADD COLUMN session_date TEXT")
+    
+    def partitions(self):
+        """Sorted (team, season) pairs with a saved roster or saved weeks, across the whole file."""
+        with closing(self._connect()) as conn:
+            return sorted(conn.execute(
+                "SELECT DISTINCT team, season FROM roster UNION SELECT DISTINCT team, season FROM weeks"
+            ).fetchall())
+    
+    def saved_weeks(self):
+        """Week -> record count for every saved week, without loading any values."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute(
+                "SELECT week, record_count FROM weeks WHERE team = ? AND season = ?", (self.team, self.season)
+            ).fetchall())
+    
+    def week_stamps(self):
+        """Week -> saved_at for every saved week; cheap enough to poll for writes from other processes."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute(
+                "SELECT week, saved_at FROM weeks WHERE team = ? AND season = ?", (self.team, self.season)
+            ).fetchall())
+    
+    def session_dates(self):
+        """Week -> ISO session date for every saved week that has one."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute(
+                "SELECT week, session_date FROM weeks WHERE team = ? AND season = ? AND session_date IS NOT NULL",
+                (self.team, self.season)
+            ).fetchall())
+    
+    @timed
+    def load_weeks(self, weeks):
+        """Week -> long (Athlete ID, Metric, Value) DataFrame for the requested weeks."""
+        placeholders = ', '.join('?' * len(weeks))
+        with closing(self._connect()) as conn:
+            rows = pd.read_sql_query(
+                f'SELECT week, athlete_id AS "Athlete ID", metric AS Metric, value AS Value '
+                f"FROM performance WHERE team = ? AND season = ? AND week IN ({placeholders})",
+                conn,
+                params=[self.team, self.season] + list(weeks)
+            )
+        rows['Value'] = rows['Value'].astype('float32')
+        
+        grouped = dict(tuple(rows.groupby('week')))
+        return {
+            week_num: grouped.get(week_num, rows.iloc[:0]).drop(columns='week').reset_index(drop=True)
+            for week_num in weeks
+        }
+    
+    def load_roster(self):
+        """The last roster saved, as an Athlete ID/Name/Position DataFrame (empty if none)."""
+        with closing(self._connect()) as conn:
+            return pd.read_sql_query(
+                'SELECT athlete_id AS "Athlete ID", name AS Name, position AS Position FROM roster '
+                'WHERE team = ? AND season = ? ORDER BY athlete_id',
+                conn,
+                params=[self.team, self.season]
+            )
+    
+    def save_roster(self, roster_df):
+        """Replace the saved roster in one transaction, picking up unmatched values saved under its names."""
+        with closing(self._connect()) as conn, conn:
+            self._write_roster(conn, roster_df)
+    
+    def _write_roster(self, conn, roster_df):
+        rows = (
+            (self.team, self.season) + row
+            for row in roster_df[['Athlete ID', 'Name', 'Position']].itertuples(index=False, name=None)
+        )
+        conn.execute("DELETE FROM roster WHERE team = ? AND season = ?", (self.team, self.season))
+        conn.executemany(
+            "INSERT INTO roster (team, season, athlete_id, name, position) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO roster_stamps (team, season, saved_at) VALUES (?, ?, ?)",
+            (self.team, self.season, datetime.now().isoformat(timespec='microseconds'))
+        )
+        self._match_unmatched(conn, self.team, self.season)
+    
+    def roster_stamp(self):
+        """(roster saved_at, position groups JSON); cheap enough to poll for roster changes from other processes."""
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT (SELECT saved_at FROM roster_stamps WHERE team = ? AND season = ?), "
+                "(SELECT position_groups FROM teams WHERE team = ?)",
+                (self.team, self.season, self.team)
+            ).fetchone()
+    
+    def load_position_groups(self):
+        """The team's position groups in display order, or None if none were saved."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT position_groups FROM teams WHERE team = ?", (self.team,)).fetchone()
+        return None if row is None else json.loads(row[0])
+    
+    def save_position_groups(self, position_groups):
+        """Set the team's position groups; they apply to every season of the team."""
+        with closing(self._connect()) as conn, conn:
+            self._write_position_groups(conn, position_groups)
+    
+    def _write_position_groups(self, conn, position_groups):
+        conn.execute(
+            "INSERT OR REPLACE INTO teams (team, position_groups) VALUES (?, ?)",
+            (self.team, json.dumps(list(position_groups)))
+        )
+    
+    def save_weeks(self, weeks_long, record_counts, session_dates=None, roster_df=None, position_groups=None):
+        """Replace the given weeks' rows in one transaction; other weeks are untouched. Returns the saved_at stamp.
+        
+        weeks_long maps weeks to long (Athlete ID, Metric, Value) DataFrames.
+        session_dates maps weeks to ISO dates; a week saved without one keeps its earlier date.
+        A season restore also passes roster_df and position_groups, replaced in the same transaction.
+        """
+        session_dates = session_dates or {}
+        saved_at = datetime.now().isoformat(timespec='microseconds')
+        with closing(self._connect()) as conn, conn:
+            if roster_df is not None:
+                self._write_roster(conn, roster_df)
+            if position_groups is not None:
+                self._write_position_groups(conn, position_groups)
+            for week_num, long_df in weeks_long.items():
+                # Inserting in primary-key order appends to the B-tree instead of splitting pages all over it
+                long_df = long_df.sort_values(['Athlete ID', 'Metric'])
+                # Shortest decimal form of each float32, so the file holds 215.3 and not 215.300003
+                values = long_df['Value'].astype('float32').astype(str).astype('float64')
+                n_rows = len(long_df)
+                rows = zip(
+                    [self.team] * n_rows,
+                    [self.season] * n_rows,
+                    [week_num] * n_rows,
+                    long_df['Athlete ID'].tolist(),
+                    long_df['Metric'].tolist(),
+                    values.tolist()
+                )
+                # Values saved by name before a migration are replaced with the week too
+                for table in ('performance', 'unmatched_performance'):
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE team = ? AND season = ? AND week = ?", (self.team, self.season, week_num)
+                    )
+                conn.executemany(
+                    "INSERT INTO performance (team, season, week, athlete_id, metric, value) VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+                conn.execute(
+                    "INSERT INTO weeks (team, season, week, record_count, saved_at, session_date) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (team, season, week) DO UPDATE SET record_count = excluded.record_count, "
+                    "saved_at = excluded.saved_at, session_date = COALESCE(excluded.session_date, weeks.session_date)",
+                    (self.team, self.season, week_num, record_counts[week_num], saved_at, session_dates.get(week_num))
+                )
+        return saved_at
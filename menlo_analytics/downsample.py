@@ -0,0 +1,42 @@
+import numpy as np
+
+# ============================================================================
+# DOWNSAMPLING
+# ============================================================================
+def lttb_indices(x, y, n_out):
+    """Positions of the n_out points Largest-Triangle-Three-Buckets keeps from the (x, y) line.
+    
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and each bucket keeps the point that forms the largest
+    triangle with the previous kept point and the next bucket's average. Peaks and
+    dips survive, unlike plain striding. x must be increasing and neither array
+    may contain NaN.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.intp), n)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_lo, next_hi = edges[bucket + 1], edges[bucket + 2]
+        next_x, next_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        area = np.abs(
+            (x[previous] - next_x) * (y[lo:hi] - y[previous]) - (x[previous] - x[lo:hi]) * (next_y - y[previous])
+        )
+        previous = keep[bucket + 1] = lo + int(np.argmax(area))
+    return keep
+
+def downsample(x, y, max_points):
+    """(x, y) without NaN points, reduced to at most max_points with LTTB."""
+    x, y = np.asarray(x), np.asarray(y)
+    present = ~np.isnan(y)
+    x, y = x[present], y[present]
+    numeric_x = x.astype('int64') if np.issubdtype(x.dtype, np.datetime64) else x
+    keep = lttb_indices(numeric_x, y, max_points)
+    return x[keep], y[keep]
@@ -0,0 +1,368 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+import datetime
+import importlib.util
+import io
+import os
+import re
+import zipfile
+
+from .metrics import METRICS
+from .profiling import timed
+from .roster import name_key
+
+# ============================================================================
+# INGEST
+# ============================================================================
+@timed
+def ingest_week(raw_df, roster):
+    """Validate an uploaded week against METRICS and the roster.
+    
+    Returns (clean_df, issues_df). clean_df has one row per matched athlete with
+    Athlete ID (the key the week is saved under), the roster spelling of Name
+    and float32 metric columns. issues_df
+    lists every problem found (Row is the spreadsheet row, counting the header).
+    """
+    metric_cols = [metric for metric in METRICS if metric in raw_df.columns]
+    rows = pd.Series(raw_df.index.to_numpy() + 2, index=raw_df.index)
+    issues = [
+        pd.DataFrame({'Row': [None], 'Name': [None], 'Column': [col], 'Problem': ['Unknown column, ignored']})
+        for col in raw_df.columns if col != 'Name' and col not in METRICS
+    ]
+    
+    # Resolve names to roster IDs with one hash lookup per row
+    athlete_ids = name_key(raw_df['Name']).map(roster.name_keys)
+    
+    # Names that differ only in accents, punctuation or word order match through the search index
+    missed = athlete_ids.isna() & raw_df['Name'].notna()
+    if missed.any():
+        resolved = raw_df.loc[missed, 'Name'].map(roster.name_index.resolve)
+        athlete_ids[missed] = resolved.map(roster.ids)
+        recovered = resolved.notna()
+        issues.append(pd.DataFrame({
+            'Row': rows[missed][recovered],
+            'Name': raw_df.loc[missed, 'Name'][recovered],
+            'Column': 'Name',
+            'Problem': 'Matched to roster name ' + resolved[recovered].astype(str)
+        }))
+    
+    unmatched = athlete_ids.isna()
+    duplicated = athlete_ids.duplicated() & ~unmatched
+    
+    def not_on_roster(name):
+        closest = roster.name_index.closest(name) if pd.notna(name) else None
+        return f"Not on the roster, row skipped (closest: {closest})" if closest else 'Not on the roster, row skipped'
+    
+    issues.append(pd.DataFrame({
+        'Row': rows[unmatched],
+        'Name': raw_df.loc[unmatched, 'Name'],
+        'Column': 'Name',
+        'Problem': raw_df.loc[unmatched, 'Name'].map(not_on_roster)
+    }))
+    issues.append(pd.DataFrame({
+        'Row': rows[duplicated],
+        'Name': raw_df.loc[duplicated, 'Name'],
+        'Column': 'Name',
+        'Problem': 'Duplicate athlete, first row kept'
+    }))
+    
+    # Coerce every metric column in one pass; blank cells are missing, anything else unparsable is flagged
+    raw_values = raw_df[metric_cols].apply(
+        lambda col: col if pd.api.types.is_numeric_dtype(col)
+        else col.astype('string').str.strip().replace('', pd.NA)
+    )
+    numeric = raw_values.apply(pd.to_numeric, errors='coerce').astype('float32')
+    bad_rows, bad_cols = np.nonzero((numeric.isna() & raw_values.notna()).to_numpy())
+    issues.append(pd.DataFrame({
+        'Row': rows.to_numpy()[bad_rows],
+        'Name': raw_df['Name'].to_numpy()[bad_rows],
+        'Column': np.array(metric_cols, dtype=object)[bad_cols],
+        'Problem': 'Not a number, saved as blank'
+    }))
+    
+    keep = ~unmatched & ~duplicated
+    clean_df = pd.concat([
+        pd.DataFrame({
+            'Athlete ID': athlete_ids[keep].astype('int64'),
+            'Name': athlete_ids[keep].map(roster.names_by_id)
+        }),
+        numeric[keep]
+    ], axis=1).reset_index(drop=True)
+    
+    issues = [frame for frame in issues if len(frame)]
+    issues_df = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=['Row', 'Name', 'Column', 'Problem'])
+    return clean_df, issues_df
+
+# ============================================================================
+# FILE READERS
+# ============================================================================
+# Optional, and imported only when a file needs them: pyarrow reads Parquet and
+# Feather/Arrow files, python-calamine parses Excel several times faster than openpyxl
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') is not None else None
+
+TABLE_EXTENSIONS = ('.csv', '.xlsx', '.parquet', '.feather', '.arrow')
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow')
+CSV_CHUNK_ROWS = 50_000
+# split_sessions() label for rows it could not place in a session
+UNKEYED_ROWS = 'Rows without a valid Week or Date'
+
+class IngestCancelled(Exception):
+    """Raised by a reader when its cancel event is set."""
+
+def _checkpoint(cancel, on_progress, fraction, text):
+    """Stop if cancelled, otherwise report progress; called between chunks, row groups, sheets and files."""
+    if cancel is not None and cancel.is_set():
+        raise IngestCancelled(f"Cancelled before: {text}")
+    if on_progress is not None:
+        on_progress(min(fraction, 1.0), text)
+
+def read_table(file_name, file_bytes, on_progress=None, cancel=None):
+    """Read one CSV, Excel sheet, Parquet or Feather/Arrow file from raw bytes.
+    
+    on_progress(fraction, text) is called as CSV chunks and Parquet row groups are
+    read, and cancel (a threading.Event) is checked between them.
+    """
+    name = file_name.lower()
+    if name.endswith(COLUMNAR_EXTENSIONS) and not HAS_PYARROW:
+        raise ImportError(f"{os.path.basename(file_name)}: Parquet and Feather/Arrow files need pyarrow installed")
+    
+    if name.endswith('.csv'):
+        if on_progress is None and cancel is None:
+            return pd.read_csv(io.BytesIO(file_bytes))
+        buffer = io.BytesIO(file_bytes)
+        chunks = []
+        with pd.read_csv(buffer, chunksize=CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                chunks.append(chunk)
+                _checkpoint(cancel, on_progress, buffer.tell() / max(len(file_bytes), 1), f"Read {sum(map(len, chunks)):,} rows")
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.read_csv(io.BytesIO(file_bytes))
+    
+    if name.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(io.BytesIO(file_bytes))
+        groups = []
+        for i in range(parquet.num_row_groups):
+            groups.append(parquet.read_row_group(i))
+            _checkpoint(cancel, on_progress, (i + 1) / parquet.num_row_groups, f"Read row group {i + 1} of {parquet.num_row_groups}")
+        return (pa.concat_tables(groups) if groups else parquet.schema_arrow.empty_table()).to_pandas()
+    
+    if name.endswith(('.feather', '.arrow')):
+        return pd.read_feather(io.BytesIO(file_bytes))
+    
+    return pd.read_excel(io.BytesIO(file_bytes), engine=EXCEL_ENGINE)
+
+def split_sessions(df, file_name):
+    """{label: DataFrame} from one table holding many sessions, split on its Week and/or Date column.
+    
+    Labels are 'Week 3', '2025-08-14' or 'Week 3 2025-08-14', ready for
+    validate_season_upload. When the Date column has times of day, labels carry
+    the time too ('2025-08-14 07:00:00'), so a morning and an afternoon session
+    become separate weeks. The key columns are dropped from each part and the
+    file's row index is kept, so issues point at file rows. Rows whose Week is
+    blank or not a whole number, or whose Date is unparsable (or blank without a
+    Week), go under UNKEYED_ROWS for validate_season_upload to report.
+    """
+    keys = [col for col in ('Week', 'Date') if col in df.columns]
+    if not keys:
+        raise ValueError(f"{os.path.basename(file_name)}: a single-table season file needs a Week or Date column")
+    
+    labels = pd.Series('', index=df.index, dtype='string')
+    valid = pd.Series(True, index=df.index)
+    if 'Week' in keys:
+        weeks = pd.to_numeric(df['Week'], errors='coerce')
+        valid &= weeks.notna() & (weeks % 1 == 0)
+        labels[valid] = 'Week ' + weeks[valid].astype('int64').astype('string')
+    if 'Date' in keys:
+        blank = df['Date'].astype('string').str.strip().fillna('') == ''
+        dates = pd.to_datetime(df['Date'].where(~blank), errors='coerce')
+        # A Week with a blank Date is an undated session; a Date that is there must parse
+        valid &= dates.notna() | (blank & ('Week' in keys))
+        timed_sessions = (dates.dropna() != dates.dropna().dt.normalize()).any()
+        label_format = '%Y-%m-%d %H:%M:%S' if timed_sessions else '%Y-%m-%d'
+        labels = (labels + ' ' + dates.dt.strftime(label_format).fillna('')).str.strip()
+    
+    parts = {label: part.drop(columns=keys) for label, part in df[valid].groupby(labels[valid].to_numpy(), sort=True)}
+    if not valid.all():
+        parts[UNKEYED_ROWS] = df[~valid].drop(columns=keys)
+    return parts
+
+def _read_files(named_readers, on_progress=None, cancel=None):
+    """{name: DataFrame} from {name: zero-argument reader}, read side by side; cancel stops the ones not started."""
+    frames = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(named_readers) or 1)) as pool:
+        futures = {pool.submit(reader): name for name, reader in named_readers.items()}
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                frames[futures[future]] = future.result()
+                _checkpoint(cancel, on_progress, done / len(futures), f"Read {done} of {len(futures)} files")
+        except IngestCancelled:
+            for future in futures:
+                future.cancel()
+            raise
+    return {name: frames[name] for name in named_readers}
+
+@timed
+def read_season(file_name, file_bytes, on_progress=None, cancel=None):
+    """Parse a season upload into {label: DataFrame}.
+    
+    Accepts a workbook with one sheet per week, a ZIP of weekly files, or a single
+    CSV/Parquet/Feather table with a Week or Date column (a device export).
+    on_progress and cancel work as in read_table, per sheet, file or chunk.
+    """
+    name = file_name.lower()
+    if name.endswith('.zip'):
+        with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive:
+            members = {
+                os.path.basename(member): archive.read(member)
+                for member in archive.namelist()
+                if member.lower().endswith(TABLE_EXTENSIONS) and not member.startswith('__MACOSX')
+            }
+        # Weekly files are independent, so parse them side by side
+        return _read_files(
+            {member: partial(read_table, member, data) for member, data in members.items()}, on_progress, cancel
+        )
+    
+    if name.endswith('.xlsx'):
+        # One workbook load, then one sheet at a time so progress and cancel work between sheets
+        with pd.ExcelFile(io.BytesIO(file_bytes), engine=EXCEL_ENGINE) as workbook:
+            frames = {}
+            for i, sheet in enumerate(workbook.sheet_names, start=1):
+                frames[sheet] = workbook.parse(sheet)
+                _checkpoint(cancel, on_progress, i / len(workbook.sheet_names), f"Read sheet '{sheet}'")
+            return frames
+    
+    return split_sessions(read_table(file_name, file_bytes, on_progress, cancel), file_name)
+
+@timed
+def read_folder(folder, on_progress=None, cancel=None):
+    """Parse every weekly file (CSV, XLSX, Parquet, Feather/Arrow) in a folder into {file name: DataFrame}."""
+    paths = sorted(
+        os.path.join(folder, entry) for entry in os.listdir(folder)
+        if entry.lower().endswith(TABLE_EXTENSIONS) and not entry.startswith(('~$', '.'))
+    )
+    
+    def read_path(path):
+        with open(path, 'rb') as f:
+            return read_table(path, f.read())
+    
+    return _read_files({os.path.basename(path): partial(read_path, path) for path in paths}, on_progress, cancel)
+
+# ============================================================================
+# SEASON UPLOADS
+# ============================================================================
+DATE_IN_LABEL = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[ T]\d{1,2}:\d{2}(?::\d{2})?)?')
+# 'Week 3', 'week_03', 'wk-3', 'football_2025_week3'; a '-' after a space is a sign ('Week -2')
+WEEK_IN_LABEL = re.compile(r'(?<![a-z])w(?:ee)?k([\s_-]*)(\d+)', re.IGNORECASE)
+# A '-' at the start or after a space is a sign ('-2.csv'); after a word it separates ('season-2.csv')
+NUMBER_IN_LABEL = re.compile(r'(?:(?<=\s)|^)-\d+|\d+')
+
+def parse_session_label(label):
+    """(week number or None, session date or None) from a sheet or file name.
+    
+    An ISO date anywhere in the label ('2025-08-14.csv', 'Week 3 2025-08-14') is
+    the session date; a time after it ('2025-08-14 15:30:00') only tells two
+    sessions on that day apart. The week is the number after 'week' or 'wk'
+    ('football_2025_week3.csv' is Week 3), or else the label's only number.
+    Raises ValueError, with the reason, for an impossible date, a negative or
+    year-like week, or several numbers with none marked as the week.
+    """
+    date = None
+    match = DATE_IN_LABEL.search(label)
+    if match:
+        try:
+            date = pd.Timestamp(datetime.date(*map(int, match.groups()[:3])))
+        except ValueError:
+            raise ValueError("not a valid date") from None
+        label = label[:match.start()] + ' ' + label[match.end():]
+    
+    marked = WEEK_IN_LABEL.search(label)
+    if marked:
+        number = ('-' if re.search(r'\s-$', marked.group(1)) else '') + marked.group(2)
+    else:
+        numbers = NUMBER_IN_LABEL.findall(label)
+        if not numbers:
+            return None, date
+        if len(numbers) > 1:
+            raise ValueError(f"more than one number ({', '.join(numbers)}) and none marked as the week; name it 'Week N'")
+        number = numbers[0]
+    
+    if number.startswith('-'):
+        raise ValueError(f"week numbers cannot be negative ({number})")
+    if len(number) == 4 and 1900 <= int(number) <= 2100:
+        raise ValueError(f"{number} looks like a year, not a week number; name it 'Week N'")
+    return int(number), date
+
+@timed
+def validate_season_upload(frames, roster, saved_dates=None, next_week=1):
+    """Map labelled week frames to week numbers and ingest each one.
+    
+    A label with only a date replaces a saved session on that date (saved_dates,
+    week -> date) when there is one, so re-importing the same files is safe;
+    otherwise it becomes a new session numbered from next_week (or after the
+    highest week in the upload), in date order, so several sessions in one week
+    never share a number. Returns ({week: clean DataFrame}, {week: session date},
+    [problems that block the import], issues DataFrame).
+    """
+    week_dfs = {}
+    session_dates = {}
+    problems = []
+    issues = []
+    
+    labelled = []
+    for label, df in frames.items():
+        if label == UNKEYED_ROWS:
+            rows = (df.index + 2).tolist()
+            shown = ', '.join(map(str, rows[:10])) + (f" and {len(rows) - 10} more" if len(rows) > 10 else "")
+            problems.append(f"Rows {shown}: blank or invalid Week or Date (weeks are whole numbers)")
+            continue
+        try:
+            week_num, date = parse_session_label(label)
+        except ValueError as e:
+            problems.append(f"'{label}': {e}")
+            continue
+        if week_num is None and date is None:
+            problems.append(f"'{label}': no week number or date in the sheet or file name")
+        else:
+            labelled.append((label, df, week_num, date))
+    
+    numbered = {week_num for _, _, week_num, _ in labelled if week_num is not None}
+    next_week = max([next_week] + [week_num + 1 for week_num in numbered])
+    reusable = {}
+    for week_num, date in sorted((saved_dates or {}).items()):
+        if week_num not in numbered:
+            reusable.setdefault(pd.Timestamp(date).normalize(), []).append(week_num)
+    
+    for label, df, week_num, date in sorted(labelled, key=lambda item: (item[2] is None, item[3] or pd.Timestamp.min, item[0])):
+        if week_num is None and reusable.get(date):
+            week_num = reusable[date].pop(0)
+        elif week_num is None:
+            week_num, next_week = next_week, next_week + 1
+        
+        if week_num < 1:
+            problems.append(f"'{label}': week numbers start at 1")
+        elif week_num in week_dfs:
+            problems.append(f"'{label}': Week {week_num} appears more than once")
+        elif 'Name' not in df.columns:
+            problems.append(f"'{label}': missing required column Name")
+        elif not any(metric in df.columns for metric in METRICS):
+            problems.append(f"'{label}': no performance metric columns found")
+        else:
+            week_dfs[week_num], week_issues = ingest_week(df, roster)
+            issues.append(week_issues.assign(Week=week_num))
+            if date is not None:
+                session_dates[week_num] = date
+    
+    if not frames:
+        file_types = ', '.join(extension[1:].upper() for extension in TABLE_EXTENSIONS)
+        problems.append(
+            f"No weeks found: expected a workbook with one sheet per week, weekly {file_types} files "
+            "in a ZIP or folder, or one table with a Week or Date column"
+        )
+    
+    issues = [frame for frame in issues if len(frame)]
+    issues_df = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=['Row', 'Name', 'Column', 'Problem', 'Week'])
+    return dict(sorted(week_dfs.items())), session_dates, problems, issues_df[['Week', 'Row', 'Name', 'Column', 'Problem']]
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# METRICS
+# ============================================================================
+METRICS = [
+    "Body Weight (lbs)",
+    "Bench Press (lbs)",
+    "Back Squat (lbs)",
+    "Hex Bar Deadlift (lbs)",
+    "Flying 10 Sprint (seconds)",
+    "Vertical Jump (inches)",
+    "Power Clean (lbs)"
+]
+
+# ============================================================================
+# NORMALIZATION
+# ============================================================================
+def normalize_values(values, metric_names, min_vals, max_vals):
+    """Vectorized 0-100 normalization against min/max. Invert for Sprint (lower is better).
+    
+    Arguments broadcast against each other. Missing values (or metrics with no
+    data) score 0 and metrics with no spread score 50, as in the scalar version.
+    """
+    values = np.asarray(values, dtype='float64')
+    min_vals = np.asarray(min_vals, dtype='float64')
+    max_vals = np.asarray(max_vals, dtype='float64')
+    invert = np.array(["Sprint" in metric for metric in np.atleast_1d(metric_names)])
+    if np.ndim(metric_names) == 0:
+        invert = invert[0]
+    
+    span = max_vals - min_vals
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = (values - min_vals) / span * 100
+    normalized = np.where(invert, 100 - normalized, normalized)
+    normalized = np.where(span == 0, 50, normalized)
+    normalized = np.where(np.isnan(values) | np.isnan(span), 0, normalized)
+    
+    return np.round(normalized, 1)
+
+def compute_week_stats(week_frame):
+    """Per-metric min, max, sum, count and team best for one week's Name x Metric frame."""
+    stats = pd.DataFrame({
+        'min': week_frame.min(),
+        'max': week_frame.max(),
+        'sum': week_frame.sum(),
+        'count': week_frame.count()
+    })
+    # For Sprint, best is minimum (fastest time)
+    stats['best'] = np.where(stats.index.str.contains('Sprint'), stats['min'], stats['max'])
+    return stats
+
+def score_week(week_frame, week_stats):
+    """Normalize every athlete and metric of a week in one array operation."""
+    stats = week_stats.reindex(week_frame.columns)
+    scores = normalize_values(
+        week_frame.to_numpy(dtype='float64'),
+        np.array(week_frame.columns),
+        stats['min'].to_numpy(dtype='float64'),
+        stats['max'].to_numpy(dtype='float64')
+    )
+    return pd.DataFrame(scores, index=week_frame.index, columns=week_frame.columns)
+
+def compute_position_aggregates(week_frame, positions):
+    """Mean, median, best and count per Position x Metric from one week's Name x Metric frame."""
+    week_values = week_frame.melt(ignore_index=False, var_name='Metric', value_name='Value').dropna()
+    joined = week_values.join(positions, how='inner')
+    aggregates = joined.groupby(['Position', 'Metric'])['Value'].agg(['mean', 'median', 'min', 'max', 'count'])
+    
+    # For Sprint, best is minimum (fastest time)
+    lower_is_better = aggregates.index.get_level_values('Metric').str.contains('Sprint')
+    aggregates['best'] = np.where(lower_is_better, aggregates['min'], aggregates['max'])
+    
+    return aggregates[['mean', 'median', 'best', 'count']]
+
+def compute_leaderboard(week_frame, previous_frame, positions):
+    """Rank, percentile and change from the previous week for every athlete and metric at once.
+    
+    Returns a (Metric, Name) indexed DataFrame. Rank 1 and percentile 100 are best;
+    for Sprint the lowest time is best and a negative change counts as improvement.
+    """
+    lower_is_better = np.array(["Sprint" in metric for metric in week_frame.columns])
+    goodness = week_frame * np.where(lower_is_better, -1, 1)
+    ranks = goodness.rank(ascending=False, method='min')
+    percentiles = goodness.rank(pct=True) * 100
+    
+    if previous_frame is None:
+        previous_frame = week_frame * np.nan
+    previous = previous_frame.reindex(index=week_frame.index, columns=week_frame.columns)
+    change = week_frame - previous
+    pct_change = change / previous.where(previous != 0) * 100
+    improvement = pct_change * np.where(lower_is_better, -1, 1)
+    
+    n_athletes, n_metrics = week_frame.shape
+    index = pd.MultiIndex.from_arrays(
+        [np.tile(week_frame.columns, n_athletes), np.repeat(week_frame.index, n_metrics)],
+        names=['Metric', 'Name']
+    )
+    leaderboard = pd.DataFrame({
+        'Position': np.repeat(week_frame.index.map(positions), n_metrics),
+        'Value': week_frame.to_numpy().ravel(),
+        'Rank': ranks.to_numpy().ravel(),
+        'Percentile': percentiles.to_numpy().ravel(),
+        'Change': change.to_numpy().ravel(),
+        '% Change': pct_change.to_numpy().ravel(),
+        'Improvement %': improvement.to_numpy().ravel()
+    }, index=index)
+    
+    return leaderboard.dropna(subset=['Value']).sort_index()
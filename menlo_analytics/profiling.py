@@ -0,0 +1,91 @@
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+import json
+import os
+import threading
+import time
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Opt-in: MENLO_PROFILE=1 turns timing on; when off, timed() returns functions
+# unchanged and section() is a no-op, so there is no overhead.
+ENABLED = os.environ.get("MENLO_PROFILE") == "1"
+
+# Optional JSON Lines file that gets one record per run for offline analysis
+LOG_PATH = os.environ.get("MENLO_PROFILE_LOG")
+
+# ============================================================================
+# TIMERS
+# ============================================================================
+# Each Streamlit session's script runs in its own thread, so the run being recorded is per thread
+_local = threading.local()
+_log_lock = threading.Lock()
+
+def _record(name, elapsed):
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        calls, total = timings.get(name, (0, 0.0))
+        timings[name] = (calls + 1, total + elapsed)
+
+def timed(func=None, *, name=None):
+    """Decorator that adds a function's calls and wall time to the current run's breakdown."""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or getattr(func, '__qualname__', None) or func.__name__
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(label, time.perf_counter() - start)
+        return wrapper
+    
+    return decorate(func) if func is not None else decorate
+
+@contextmanager
+def _timed_section(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, time.perf_counter() - start)
+
+def section(name):
+    """Context manager that times a block of code under `name`."""
+    return _timed_section(name) if ENABLED else nullcontext()
+
+# ============================================================================
+# RUN RECORDS
+# ============================================================================
+def start_run():
+    """Begin collecting timings for this run (a dashboard rerun or a CLI command)."""
+    if ENABLED:
+        _local.timings = {}
+        _local.started = time.perf_counter()
+
+def finish_run(label):
+    """Close this run's timings and append them to LOG_PATH; returns the record, or None when disabled."""
+    if not ENABLED or getattr(_local, 'timings', None) is None:
+        return None
+    
+    timings, _local.timings = _local.timings, None
+    record = {
+        'time': datetime.now().isoformat(timespec='milliseconds'),
+        'page': label,
+        'total_ms': round((time.perf_counter() - _local.started) * 1000, 3),
+        'sections': {
+            name: {'calls': calls, 'ms': round(total * 1000, 3)}
+            for name, (calls, total) in timings.items()
+        }
+    }
+    
+    if LOG_PATH:
+        with _log_lock, open(LOG_PATH, 'a', encoding='utf-8') as log:
+            log.write(json.dumps(record) + '\n')
+    
+    return record
@@ -0,0 +1,202 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import io
+import multiprocessing
+import os
+import zipfile
+
+from .cards import render_card_files
+from .metrics import METRICS, normalize_values
+from .profiling import timed
+
+# ============================================================================
+# ATHLETE AND GROUP LOOKUPS
+# ============================================================================
+# Every helper takes the PerformanceStore explicitly, so it runs the same in the
+# dashboard, the CLI and scheduled jobs.
+@timed
+def normalize_metric(store, value, metric_name, week_num):
+    """Normalize metrics to 0-100 scale using the week's stats. Invert for Sprint (lower is better)."""
+    if not store.has_week(week_num):
+        return 0
+    
+    week_stats = store.week_stats(week_num)
+    if metric_name not in week_stats.index or pd.isna(value):
+        return 0
+    
+    stats = week_stats.loc[metric_name]
+    return float(normalize_values(value, metric_name, stats['min'], stats['max']))
+
+@timed
+def calculate_body_weight_change(store, athlete_name, current_week):
+    """Calculate % change in body weight from Week 1 to current week."""
+    if not store.has_week(current_week):
+        return None
+    
+    pct_change = store.body_weight_change(current_week).get(athlete_name)
+    if pct_change is None:
+        return None
+    return round(float(pct_change), 2)
+
+@timed
+def get_position_average(store, position, week_num, metric):
+    """Calculate average metric for a position group."""
+    if not store.has_week(week_num):
+        return None
+    
+    aggregates = store.position_aggregates(week_num)
+    
+    if (position, metric) in aggregates.index:
+        return aggregates.at[(position, metric), 'mean']
+    
+    return None
+
+@timed
+def get_team_best(store, week_num, metric):
+    """Get team best for a metric."""
+    if not store.has_week(week_num):
+        return None
+    
+    week_stats = store.week_stats(week_num)
+    
+    if metric in week_stats.index:
+        return week_stats.at[metric, 'best']
+    
+    return None
+
+# ============================================================================
+# SUMMARIES AND FLAGS
+# ============================================================================
+@timed
+def week_summary(store, week_num):
+    """Count, mean, median and best per metric for the team and for each position in one week."""
+    frame = store.week_frame(week_num)
+    stats = store.week_stats(week_num)
+    team = pd.DataFrame({
+        'mean': stats['sum'] / stats['count'],
+        'median': frame.median(),
+        'best': stats['best'],
+        'count': stats['count']
+    })
+    team.index = pd.MultiIndex.from_product([['Team'], team.index], names=['Position', 'Metric'])
+    positions = store.position_aggregates(week_num).reindex(store.roster.position_groups, level='Position')
+    return pd.concat([team, positions]).reset_index()
+
+@timed
+def athlete_flags(store, week_num, weight_change_pct=5.0, drop_pct=10.0):
+    """Athletes to follow up on in one week.
+    
+    Flags body weight that moved more than weight_change_pct % from Week 1, and any
+    metric more than drop_pct % worse than the previous saved week (Sprint: slower).
+    """
+    flags = []
+    
+    weight = 'Body Weight (lbs)'
+    change = store.body_weight_change(week_num) if week_num != 1 else pd.Series(dtype='float64')
+    flagged = change[change.abs() > weight_change_pct]
+    if len(flagged):
+        flags.append(pd.DataFrame({
+            'Name': flagged.index,
+            'Metric': weight,
+            'Value': store.week_frame(week_num).loc[flagged.index, weight].to_numpy(),
+            'Change %': flagged.to_numpy(),
+            'Flag': f'Body weight moved more than {weight_change_pct:g}% since Week 1'
+        }))
+    
+    leaderboard = store.leaderboard(week_num)
+    dropped = leaderboard[leaderboard['Improvement %'] < -drop_pct].reset_index()
+    flags.append(pd.DataFrame({
+        'Name': dropped['Name'],
+        'Metric': dropped['Metric'],
+        'Value': dropped['Value'],
+        'Change %': dropped['% Change'],
+        'Flag': f'More than {drop_pct:g}% worse than the previous week'
+    }))
+    
+    flags = pd.concat(flags, ignore_index=True)
+    flags.insert(1, 'Position', flags['Name'].map(store.roster.positions))
+    return flags.sort_values(['Name', 'Metric']).reset_index(drop=True)
+
+# ============================================================================
+# PLAYER CARDS
+# ============================================================================
+def build_progress_rows(start_data, end_data, start_week, end_week):
+    """Player Card progress table rows for the metrics recorded in both weeks."""
+    progress_data = []
+    
+    for metric in METRICS:
+        if metric in start_data and metric in end_data:
+            start_val = start_data[metric]
+            end_val = end_data[metric]
+            
+            if not pd.isna(start_val) and not pd.isna(end_val):
+                diff = end_val - start_val
+                pct_change = (diff / start_val * 100) if start_val != 0 else 0
+                
+                progress_data.append({
+                    'Metric': metric,
+                    f'Week {start_week}': f"{start_val:.2f}",
+                    f'Week {end_week}': f"{end_val:.2f}",
+                    'Change': f"{diff:+.2f}",
+                    '% Change': f"{pct_change:+.1f}%"
+                })
+    
+    return progress_data
+
+@timed
+def build_player_cards(store, start_week, end_week):
+    """Plain-data Player Card payloads for every rostered athlete with data in both weeks."""
+    weeks_range = [w for w in store.weeks if start_week <= w <= end_week]
+    store.load_weeks(weeks_range)
+    
+    # Body weight for every athlete across the range in one cube slice
+    cube = store.cube
+    weights = cube.values[:, [cube.week_slots[w] for w in weeks_range], cube.metrics.get_loc('Body Weight (lbs)')]
+    generated_on = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    
+    cards = []
+    for name, position in zip(store.roster.names, store.roster.frame['Position']):
+        start_data = store.athlete_week(name, start_week)
+        end_data = store.athlete_week(name, end_week)
+        if start_data is None or end_data is None:
+            continue
+        
+        athlete_weights = weights[cube.athletes.get_loc(store.roster.ids[name])]
+        recorded = ~np.isnan(athlete_weights)
+        current_weight = end_data.get('Body Weight (lbs)')
+        cards.append({
+            'athlete_id': int(store.roster.ids[name]),
+            'name': name,
+            'position': position,
+            'start_week': start_week,
+            'end_week': end_week,
+            'current_weight': None if current_weight is None else float(current_weight),
+            'progress': build_progress_rows(start_data, end_data, start_week, end_week),
+            'weight_weeks': [w for w, has_weight in zip(weeks_range, recorded) if has_weight],
+            'weight_values': athlete_weights[recorded].tolist(),
+            'generated_on': generated_on
+        })
+    
+    return cards
+
+@timed
+def export_player_cards(cards, include_pdf=False, on_progress=None):
+    """Render cards in a process pool and return them as ZIP bytes; calls on_progress(fraction, text) per card if given."""
+    buffer = io.BytesIO()
+    # spawn, not fork: forking the multi-threaded Streamlit server is unsafe
+    pool = ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 8),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+    
+    with pool, zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        futures = [pool.submit(render_card_files, card, include_pdf) for card in cards]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for file_name, data in future.result():
+                archive.writestr(file_name, data)
+            if on_progress is not None:
+                on_progress(done / len(futures), f"Rendered {done} of {len(futures)} cards")
+    
+    return buffer.getvalue()
@@ -0,0 +1,85 @@
+import pandas as pd
+from functools import cached_property
+import os
+
+from .search import NameIndex
+
+# ============================================================================
+# ROSTER
+# ============================================================================
+def name_key(names):
+    """Normalize a Series of names for matching: trimmed, single-spaced, case-folded."""
+    return names.astype('string').str.strip().str.replace(r'\s+', ' ', regex=True).str.casefold()
+
+class Roster:
+    """Athletes keyed by a stable Athlete ID, with hash indexes for name lookups.
+    
+    Built once per process and shared. `frame` keeps file order with the Athlete ID,
+    Name and Position columns (plus any extra columns); `sorted_names` is ready for
+    selectboxes and `positions` is a Name-indexed Series for vectorized joins.
+    `position_groups` is the team's display order of positions: the order given,
+    then any other positions on the roster in order of first appearance.
+    `name_index` serves the search boxes and name pickers.
+    """
+    
+    COLUMNS = ['Athlete ID', 'Name', 'Position']
+    
+    def __init__(self, roster_df, position_groups=None):
+        missing = [col for col in self.COLUMNS if col not in roster_df.columns]
+        if missing:
+            raise ValueError(f"Roster is missing column(s): {', '.join(missing)}")
+        
+        frame = roster_df.dropna(subset=['Name']).reset_index(drop=True)
+        frame['Athlete ID'] = frame['Athlete ID'].astype('int64')
+        frame['Name'] = frame['Name'].astype(str).str.strip()
+        for col in ('Athlete ID', 'Name'):
+            duplicates = frame.loc[frame[col].duplicated(), col].tolist()
+            if duplicates:
+                raise ValueError(f"Roster has duplicate {col} values: {duplicates[:5]}")
+        
+        self.frame = frame
+        self.names = frame['Name'].tolist()
+        self.sorted_names = sorted(self.names)
+        self.positions = frame.set_index('Name')['Position']
+        self.ids = dict(zip(self.names, frame['Athlete ID'].tolist()))
+        self.names_by_id = dict(zip(frame['Athlete ID'].tolist(), self.names))
+        self.name_keys = dict(zip(name_key(frame['Name']), frame['Athlete ID'].tolist()))
+        self._positions = dict(zip(self.names, frame['Position'].tolist()))
+        groups = list(position_groups or [])
+        self.position_groups = groups + [pos for pos in frame['Position'].unique().tolist() if pos not in groups]
+    
+    @cached_property
+    def name_index(self):
+        """NameIndex over the roster names, built on first search."""
+        return NameIndex(self.names)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __contains__(self, athlete_name):
+        return athlete_name in self._positions
+    
+    def position(self, athlete_name):
+        """Position for a roster name, or None."""
+        return self._positions.get(athlete_name)
+
+def load_roster(path, database, position_groups=None):
+    """Roster from the CSV at path, saved to the database; falls back to the saved copy when path is None or absent.
+    
+    Position groups passed in replace the team's saved ones; otherwise the saved
+    order is used and any new positions on the roster are appended to it.
+    """
+    saved_groups = database.load_position_groups()
+    if path is not None and os.path.exists(path):
+        roster = Roster(pd.read_csv(path), position_groups or saved_groups)
+        database.save_roster(roster.frame)
+    else:
+        saved = database.load_roster()
+        if saved.empty:
+            where = "No roster file given" if path is None else f"No roster at {path}"
+            raise FileNotFoundError(f"{where} and none saved for {database.team} {database.season} in {database.path}")
+        roster = Roster(saved, position_groups or saved_groups)
+    
+    if roster.position_groups != saved_groups:
+        database.save_position_groups(roster.position_groups)
+    return roster
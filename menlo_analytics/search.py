@@ -0,0 +1,117 @@
+import numpy as np
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+import re
+import unicodedata
+
+# ============================================================================
+# NAME SEARCH
+# ============================================================================
+def normalize_name(text):
+    """Accent-, case- and punctuation-insensitive form of a name: 'Jaramillo-López, Tomás' -> 'jaramillo lopez tomas'."""
+    text = str(text)
+    if not text.isascii():
+        text = ''.join(ch for ch in unicodedata.normalize('NFKD', text) if not unicodedata.combining(ch))
+    return ' '.join(re.sub(r'[\W_]+', ' ', text.casefold()).split())
+
+def trigrams(key):
+    """Character trigrams of a normalized name, padded so word starts count."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameIndex:
+    """Ranked athlete name search, built once per roster.
+    
+    Names are normalized and kept in two sorted lists, whole names and single
+    words, so prefix queries are two bisections. A trigram map finds typos and
+    partial spellings that no prefix covers. Matches rank as: exact name, name
+    starting with the query, every query word starting a word of the name, then
+    trigram overlap; ties are alphabetical.
+    """
+    
+    # Share of the query's trigrams a name must contain to count as a fuzzy match
+    MIN_OVERLAP = 0.5
+    
+    def __init__(self, names):
+        self.names = list(names)
+        self.keys = [normalize_name(name) for name in self.names]
+        
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[i] for i in order]
+        self._sorted_key_ids = np.array(order, dtype=np.intp)
+        self._alpha_rank = np.empty(len(order), dtype=np.intp)
+        self._alpha_rank[order] = np.arange(len(order))
+        
+        words = sorted((word, i) for i, key in enumerate(self.keys) for word in key.split())
+        self._words = [word for word, _ in words]
+        self._word_ids = np.array([i for _, i in words], dtype=np.intp)
+        
+        self._by_words = defaultdict(list)
+        postings = defaultdict(list)
+        self._gram_counts = np.empty(len(self.keys), dtype=np.intp)
+        for i, key in enumerate(self.keys):
+            self._by_words[tuple(sorted(key.split()))].append(i)
+            grams = trigrams(key)
+            self._gram_counts[i] = len(grams)
+            for gram in grams:
+                postings[gram].append(i)
+        self._postings = {gram: np.array(ids, dtype=np.intp) for gram, ids in postings.items()}
+    
+    @staticmethod
+    def _prefix_range(sorted_list, prefix):
+        return bisect_left(sorted_list, prefix), bisect_left(sorted_list, prefix + '\uffff')
+    
+    def _overlap(self, key):
+        """(shared trigram count per name, number of query trigrams)."""
+        shared = np.zeros(len(self.keys), dtype=np.intp)
+        query_grams = trigrams(key)
+        for gram in query_grams:
+            ids = self._postings.get(gram)
+            if ids is not None:
+                shared[ids] += 1
+        return shared, len(query_grams)
+    
+    def search(self, query, limit=20):
+        """Roster names matching query, best first; limit=None returns every match."""
+        key = normalize_name(query)
+        if not key or not self.keys:
+            return []
+        scores = np.zeros(len(self.keys))
+        
+        # Every query word must start some word of the name
+        candidates = None
+        for word in key.split():
+            lo, hi = self._prefix_range(self._words, word)
+            ids = np.unique(self._word_ids[lo:hi])
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+        scores[candidates] = 2
+        
+        lo, hi = self._prefix_range(self._sorted_keys, key)
+        scores[self._sorted_key_ids[lo:hi]] = 3
+        exact = slice(bisect_left(self._sorted_keys, key), bisect_right(self._sorted_keys, key))
+        scores[self._sorted_key_ids[exact]] = 4
+        
+        if limit is None or np.count_nonzero(scores) < limit:
+            shared, n_grams = self._overlap(key)
+            overlap = shared / n_grams
+            fuzzy = (scores == 0) & (overlap >= self.MIN_OVERLAP)
+            scores[fuzzy] = overlap[fuzzy]
+        
+        matched = np.flatnonzero(scores)
+        ranked = matched[np.lexsort((self._alpha_rank[matched], -scores[matched]))]
+        return [self.names[i] for i in ranked[:limit]]
+    
+    def resolve(self, name):
+        """The one roster name with the same words as name (ignoring accents, case, punctuation and order), or None."""
+        ids = self._by_words.get(tuple(sorted(normalize_name(name).split())), [])
+        return self.names[ids[0]] if len(ids) == 1 else None
+    
+    def closest(self, name, min_similarity=0.6):
+        """Most similar roster name by trigram overlap (Dice coefficient), or None below min_similarity."""
+        key = normalize_name(name)
+        if not key or not self.keys:
+            return None
+        shared, n_grams = self._overlap(key)
+        similarity = 2 * shared / (n_grams + self._gram_counts)
+        best = int(np.argmax(similarity))
+        return self.names[best] if similarity[best] >= min_similarity else None
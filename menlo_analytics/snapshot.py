@@ -0,0 +1,140 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import io
+import json
+
+from .ingest import HAS_PYARROW
+from .metrics import METRICS
+from .profiling import timed
+from .roster import Roster
+
+# ============================================================================
+# SEASON SNAPSHOTS
+# ============================================================================
+# A whole (team, season) in one compressed columnar file: one row per athlete
+# and week with its values, 0-100 scores and body weight change, plus the roster
+# and position groups in the file metadata. Parquet suits analysts' tools; the
+# Arrow IPC (Feather) form loads fastest. Both need pyarrow.
+FORMAT = 'menlo-season'
+FORMAT_VERSION = 1
+METADATA_KEY = b'menlo'
+SNAPSHOT_FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+SCORE_SUFFIX = ' Score'
+WEIGHT_CHANGE = 'Body Weight Change (%)'
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("Season snapshots need pyarrow installed")
+
+def snapshot_frame(store):
+    """Every saved athlete-week as Week, Date, Athlete ID, Name, Position, values, scores and body weight change."""
+    weeks = store.weeks
+    store.load_weeks(weeks)
+    parts = []
+    for week_num in weeks:
+        frame = store.week_frame(week_num).reindex(columns=METRICS)
+        scores = store.week_scores(week_num).reindex(index=frame.index, columns=METRICS)
+        part = pd.concat([frame, scores.add_suffix(SCORE_SUFFIX)], axis=1).astype('float32')
+        part[WEIGHT_CHANGE] = store.body_weight_change(week_num).reindex(frame.index).astype('float32')
+        part.insert(0, 'Week', np.int32(week_num))
+        parts.append(part)
+    
+    columns = METRICS + [metric + SCORE_SUFFIX for metric in METRICS] + [WEIGHT_CHANGE]
+    frame = pd.concat(parts) if parts else pd.DataFrame(columns=['Week'] + columns, dtype='float32')
+    frame = frame.rename_axis(index='Name', columns=None).reset_index()
+    frame['Week'] = frame['Week'].astype('int32')
+    frame.insert(1, 'Date', pd.to_datetime(frame['Week'].map(store.session_dates)).astype('datetime64[ms]'))
+    frame.insert(2, 'Athlete ID', frame['Name'].map(store.roster.ids).astype('int64'))
+    frame.insert(4, 'Position', pd.Categorical(frame['Name'].map(store.roster.positions), store.roster.position_groups))
+    frame['Name'] = pd.Categorical(frame['Name'], store.roster.sorted_names)
+    return frame[['Week', 'Date', 'Athlete ID', 'Name', 'Position'] + columns]
+
+@timed
+def export_snapshot(store, team, season, fmt='parquet'):
+    """The store's season as Parquet or Arrow bytes (zstd-compressed), with the roster kept in the file metadata."""
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    
+    table = pa.Table.from_pandas(snapshot_frame(store), preserve_index=False)
+    table = table.set_column(1, 'Date', table['Date'].cast(pa.date32()))
+    roster_frame = store.roster.frame
+    info = {
+        'format': FORMAT,
+        'version': FORMAT_VERSION,
+        'team': team,
+        'season': str(season),
+        'exported_at': datetime.now().isoformat(timespec='seconds'),
+        'metrics': METRICS,
+        'position_groups': store.roster.position_groups,
+        'roster': {col: roster_frame[col].tolist() for col in Roster.COLUMNS},
+    }
+    table = table.replace_schema_metadata({**table.schema.metadata, METADATA_KEY: json.dumps(info).encode()})
+    
+    buffer = io.BytesIO()
+    if fmt == 'parquet':
+        pq.write_table(table, buffer, compression='zstd')
+    elif fmt == 'arrow':
+        feather.write_feather(table, buffer, compression='zstd')
+    else:
+        raise ValueError(f"Unknown snapshot format {fmt!r}; expected one of {', '.join(SNAPSHOT_FORMATS)}")
+    return buffer.getvalue()
+
+@timed
+def read_snapshot(file_bytes):
+    """(roster, week_dfs, session_dates, info) from export_snapshot() bytes.
+    
+    Only the Week, Date, Athlete ID, Name and raw metric columns are read; scores
+    are derived data and are recomputed when the weeks are saved. week_dfs are
+    Athlete ID, Name + metric DataFrames like a validated upload, split by week
+    with one sort.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+    
+    source = pa.BufferReader(file_bytes)
+    if file_bytes[:4] == b'PAR1':
+        schema = pq.read_schema(source)
+    elif file_bytes[:6] == b'ARROW1':
+        schema = ipc.open_file(source).schema
+    else:
+        raise ValueError("Not a season export: expected a Parquet or Arrow file")
+    
+    raw = (schema.metadata or {}).get(METADATA_KEY)
+    info = json.loads(raw) if raw is not None else {}
+    if info.get('format') != FORMAT:
+        raise ValueError("Not a season export: the file has no season metadata")
+    if info['version'] > FORMAT_VERSION:
+        raise ValueError(f"Season export version {info['version']} is newer than this app reads ({FORMAT_VERSION})")
+    
+    metrics = [metric for metric in info['metrics'] if metric in METRICS]
+    columns = ['Week', 'Date', 'Athlete ID', 'Name'] + metrics
+    read = pq.read_table if file_bytes[:4] == b'PAR1' else feather.read_table
+    table = read(pa.BufferReader(file_bytes), columns=columns)
+    frame = table.to_pandas()
+    frame['Name'] = frame['Name'].astype(str)
+    
+    roster = Roster(pd.DataFrame(info['roster']), info['position_groups'])
+    frame = frame.sort_values('Week', kind='stable')
+    weeks, starts = np.unique(frame['Week'].to_numpy(), return_index=True)
+    ends = np.append(starts[1:], len(frame))
+    week_dfs, session_dates = {}, {}
+    for week_num, start, end in zip(weeks.tolist(), starts, ends):
+        week_dfs[week_num] = frame.iloc[start:end][['Athlete ID', 'Name'] + metrics].reset_index(drop=True)
+        date = frame['Date'].iat[start]
+        if not pd.isna(date):
+            session_dates[week_num] = pd.Timestamp(date)
+    return roster, week_dfs, session_dates, info
+
+@timed
+def restore_snapshot(store, roster, week_dfs, session_dates):
+    """Replace the store's roster and position groups with the snapshot's and save its weeks, all in one transaction.
+    
+    Weeks in the snapshot replace the saved weeks with the same numbers; other saved weeks are kept.
+    """
+    store.save_weeks(week_dfs, session_dates, roster=roster)
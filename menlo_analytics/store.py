@@ -0,0 +1,411 @@
+import pandas as pd
+import numpy as np
+import threading
+
+from .cube import SeasonCube
+from .metrics import METRICS, compute_leaderboard, compute_position_aggregates, compute_week_stats, score_week
+from .profiling import timed
+from .roster import Roster
+
+WEIGHT = 'Body Weight (lbs)'
+
+# ============================================================================
+# PERFORMANCE STORE
+# ============================================================================
+class PerformanceStore:
+    """Season performance values backed by a SeasonCube, plus per-week derived data.
+    
+    With a database attached, saved weeks are listed at startup but their values
+    are only read from disk the first time a page asks for them; refresh() picks
+    up weeks and rosters saved by another process, such as the nightly CLI. One instance is
+    shared by every session: writes take a lock and bump `version`.
+    
+    Each week also keeps the version it last changed at, so a result that only
+    depends on some weeks (a leaderboard, a radar chart, the Week 1 baselines)
+    can key on revision(weeks) and survive saves to the other weeks.
+    
+    The cube is keyed by Athlete ID and every method here takes and returns roster
+    names, mapped through the current Roster, so renaming an athlete on the
+    roster keeps their history.
+    
+    A week is one testing session and may carry a session date. Dated sessions
+    are kept in a date-sorted timeline, so a date range is two binary searches
+    (sessions_between) and a single cube gather (dated_values, rollup).
+    """
+    
+    def __init__(self, roster, database=None):
+        self.cube = SeasonCube(roster.ids.values(), METRICS)
+        self.database = database
+        self.version = 0
+        self._lock = threading.RLock()
+        self.record_counts = database.saved_weeks() if database is not None else {}
+        self._saved_at = database.week_stamps() if database is not None else {}
+        self._roster_stamp = database.roster_stamp() if database is not None else None
+        self.session_dates = {}
+        self._set_session_dates(database.session_dates() if database is not None else {})
+        self._week_frames = {}
+        self._week_stats = {}
+        self._week_scores = {}
+        self._week_revisions = {}
+        self._derived = {}
+        self.set_roster(roster)
+    
+    @property
+    def weeks(self):
+        """Sorted list of weeks that have been saved."""
+        return sorted(self.record_counts)
+    
+    def set_roster(self, roster):
+        """Set the Roster, re-aligning the cube and rebuilding loaded weeks' derived data."""
+        with self._lock:
+            self.roster = roster
+            self.cube.set_athletes(roster.ids.values())
+            self._position_aggs = {}
+            for week_num in list(self._week_frames):
+                self._build_week(week_num)
+            self.version += 1
+            self._roster_revision = self.version
+    
+    def has_week(self, week_num):
+        return week_num in self.record_counts
+    
+    def save_week(self, week_num, week_df, session_date=None):
+        """Replace a week's values with the metric columns of an uploaded DataFrame."""
+        self.save_weeks({week_num: week_df}, None if session_date is None else {week_num: session_date})
+    
+    @timed
+    def save_weeks(self, week_dfs, session_dates=None, roster=None):
+        """Replace several weeks at once: one database transaction and one version bump.
+        
+        session_dates maps weeks to dates; weeks saved without one keep their earlier date.
+        A roster (a season restore) replaces the saved roster and position groups in the same transaction.
+        """
+        weeks_long = {week_num: self._to_long(week_df, roster or self.roster) for week_num, week_df in week_dfs.items()}
+        record_counts = {week_num: len(week_df) for week_num, week_df in week_dfs.items()}
+        session_dates = {week_num: pd.Timestamp(date).normalize() for week_num, date in (session_dates or {}).items()}
+        
+        with self._lock:
+            if self.database is not None:
+                saved_at = self.database.save_weeks(
+                    weeks_long,
+                    record_counts,
+                    {week_num: date.date().isoformat() for week_num, date in session_dates.items()},
+                    None if roster is None else roster.frame,
+                    None if roster is None else roster.position_groups
+                )
+                self._saved_at.update(dict.fromkeys(weeks_long, saved_at))
+            if roster is not None:
+                self.set_roster(roster)
+                if self.database is not None:
+                    self._roster_stamp = self.database.roster_stamp()
+            self.record_counts.update(record_counts)
+            self._set_session_dates({**self.session_dates, **session_dates})
+            self._add_weeks(weeks_long)
+            self._bump(weeks_long)
+    
+    def refresh(self):
+        """Pick up a roster and drop weeks that another process saved since they were loaded; True if anything changed."""
+        if self.database is None:
+            return False
+        stamps = self.database.week_stamps()
+        roster_stamp = self.database.roster_stamp()
+        if stamps == self._saved_at and roster_stamp == self._roster_stamp:
+            return False
+        
+        with self._lock:
+            if roster_stamp != self._roster_stamp:
+                self._roster_stamp = roster_stamp
+                saved = self.database.load_roster()
+                if not saved.empty:
+                    self.set_roster(Roster(saved, self.database.load_position_groups()))
+            if stamps == self._saved_at:
+                return True
+            changed = [week for week in set(stamps) | set(self._saved_at) if stamps.get(week) != self._saved_at.get(week)]
+            self.record_counts = self.database.saved_weeks()
+            self._saved_at = stamps
+            self._set_session_dates(self.database.session_dates())
+            for week_num in changed:
+                # Frame first: load_weeks() treats a week with a frame as fully loaded
+                self._week_frames.pop(week_num, None)
+                self._week_stats.pop(week_num, None)
+                self._week_scores.pop(week_num, None)
+                self._position_aggs.pop(week_num, None)
+            self._bump(changed)
+        return True
+    
+    def _set_session_dates(self, session_dates):
+        """Replace the week -> date map and rebuild the date-sorted timeline of dated sessions."""
+        self.session_dates = {week_num: pd.Timestamp(date) for week_num, date in session_dates.items()}
+        dated = sorted((date, week_num) for week_num, date in self.session_dates.items())
+        self._timeline = (
+            np.array([date for date, _ in dated], dtype='datetime64[ns]'),
+            np.array([week_num for _, week_num in dated], dtype='int64')
+        )
+    
+    def _bump(self, weeks):
+        """New version, recorded as the revision of the weeks that just changed."""
+        self.version += 1
+        for week_num in weeks:
+            self._week_revisions[week_num] = self.version
+    
+    def revision(self, weeks=None):
+        """Cache key for results derived from the given weeks (all weeks if None).
+        
+        Changes when any of those weeks or the roster changes, and not on saves to
+        other weeks. Weeks not saved yet count too, so saving one changes the key.
+        """
+        if weeks is None:
+            return self.version
+        return (self._roster_revision,) + tuple((week, self._week_revisions.get(week, 0)) for week in weeks)
+    
+    def _derive(self, name, weeks, compute):
+        """Return compute() for these dependency weeks, reusing the last result until revision(weeks) changes."""
+        key = self.revision(weeks)
+        cached = self._derived.get(name)
+        if cached is None or cached[0] != key:
+            self.load_weeks(weeks)
+            cached = (key, compute())
+            self._derived[name] = cached
+        return cached[1]
+    
+    @staticmethod
+    def _to_long(week_df, roster):
+        """Melt an uploaded week's metric columns to (Athlete ID, Metric, Value) rows.
+        
+        The Athlete ID column that ingest_week() resolved is used as is; a frame
+        without one is matched by exact roster Name, and names not on it are dropped.
+        """
+        metric_cols = [metric for metric in METRICS if metric in week_df.columns]
+        if 'Athlete ID' not in week_df.columns:
+            week_df = week_df.assign(**{'Athlete ID': week_df['Name'].map(roster.ids)})
+        long_df = week_df.melt(
+            id_vars='Athlete ID',
+            value_vars=metric_cols,
+            var_name='Metric',
+            value_name='Value'
+        )
+        long_df = long_df.dropna(subset=['Athlete ID', 'Value']).astype({'Athlete ID': 'int64'})
+        # Duplicate rows for an athlete keep the first occurrence
+        return long_df.drop_duplicates(subset=['Athlete ID', 'Metric'], keep='first')
+    
+    def load_weeks(self, weeks):
+        """Read any of the given saved weeks that are not in memory yet."""
+        if self.database is None or all(week in self._week_frames for week in weeks):
+            return
+        
+        with self._lock:
+            missing = [week for week in weeks if week in self.record_counts and week not in self._week_frames]
+            if missing:
+                self._add_weeks(self.database.load_weeks(missing))
+    
+    def _add_weeks(self, weeks_long):
+        """Write {week: long DataFrame} into the cube and build those weeks' derived data."""
+        for week_num, long_df in weeks_long.items():
+            self.cube.set_week(week_num, long_df.set_index(['Athlete ID', 'Metric'])['Value'].unstack('Metric'))
+            self._build_week(week_num)
+    
+    @timed
+    def _build_week(self, week_num):
+        """Compute one week's derived data from its cube slice, once instead of on every rerun."""
+        frame = self.cube.week_frame(week_num)
+        frame.index = pd.Index(frame.index.map(self.roster.names_by_id), name='Name')
+        week_stats = compute_week_stats(frame)
+        self._week_stats[week_num] = week_stats
+        self._week_scores[week_num] = score_week(frame, week_stats)
+        self._position_aggs[week_num] = compute_position_aggregates(frame, self.roster.positions)
+        # Set last: load_weeks() treats a week with a frame as fully loaded
+        self._week_frames[week_num] = frame
+    
+    def get(self, athlete_name, week_num, metric):
+        """Point lookup of a single value, or None if it was not recorded."""
+        self.load_weeks([week_num])
+        value = self.cube.value(self.roster.ids.get(athlete_name), week_num, metric)
+        return None if np.isnan(value) else value
+    
+    @timed
+    def athlete_week(self, athlete_name, week_num):
+        """Metric -> value Series of the metrics recorded for one athlete in one week, or None."""
+        self.load_weeks([week_num])
+        athlete_values = self.cube.athlete_week(self.roster.ids.get(athlete_name), week_num)
+        if athlete_values is None or np.isnan(athlete_values).all():
+            return None
+        return pd.Series(athlete_values, index=self.cube.metrics, name='Value').dropna()
+    
+    @timed
+    def athlete_series(self, athlete_name, metric, weeks=None):
+        """Week -> value Series of one metric for one athlete, sorted by week.
+        
+        Pass `weeks` to load and return only those weeks instead of the whole season.
+        """
+        self.load_weeks(self.weeks if weeks is None else weeks)
+        cube_weeks, values = self.cube.athlete_series(self.roster.ids.get(athlete_name), metric)
+        series = pd.Series(values, index=pd.Index(cube_weeks, name='Week'), name='Value').dropna()
+        return series if weeks is None else series[series.index.isin(weeks)]
+    
+    def position_series(self, position, metric):
+        """(weeks, names, athletes x weeks float32 values) of one metric for every athlete at a position.
+        
+        Read from the cube once per season revision, for charts that overlay a whole
+        position group.
+        """
+        def compute():
+            names = self.roster.positions.index[self.roster.positions == position].tolist()
+            weeks, values = self.cube.metric_matrix([self.roster.ids[name] for name in names], metric)
+            return list(weeks), names, values
+        return self._derive(('position series', position, metric), self.weeks, compute)
+    
+    def position_band(self, position, metric):
+        """Week-indexed mean, std and count of one metric across a position group."""
+        def compute():
+            weeks, _, values = self.position_series(position, metric)
+            band = pd.DataFrame(values, columns=pd.Index(weeks, name='Week'), dtype='float64')
+            return band.agg(['mean', 'std', 'count']).T
+        return self._derive(('position band', position, metric), self.weeks, compute)
+    
+    def date_span(self):
+        """(first, last) session dates, or None when no session has a date."""
+        dates, _ = self._timeline
+        return (pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])) if len(dates) else None
+    
+    def sessions_between(self, start=None, end=None):
+        """Dated sessions (week numbers) from start to end inclusive, in date order; None leaves that end open."""
+        dates, weeks = self._timeline
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(start).normalize(), 'ns'), 'left')
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(end).normalize(), 'ns'), 'right')
+        return weeks[lo:hi].tolist()
+    
+    @timed
+    def dated_values(self, metric, athletes=None, start=None, end=None):
+        """Date x athlete DataFrame of one metric over the dated sessions in a range (every athlete if None).
+        
+        Sessions on the same day keep separate rows. Undated sessions are left out.
+        """
+        weeks = self.sessions_between(start, end)
+        self.load_weeks(weeks)
+        names = self.roster.names if athletes is None else list(athletes)
+        _, values = self.cube.metric_matrix([self.roster.ids.get(name) for name in names], metric, weeks)
+        dates = pd.DatetimeIndex([self.session_dates[week_num] for week_num in weeks], name='Date')
+        return pd.DataFrame(values.T, index=dates, columns=pd.Index(names, name='Name'))
+    
+    def rollup(self, metric, freq='W', athletes=None, start=None, end=None, how='mean'):
+        """dated_values() resampled to calendar periods ('W' weekly, 'MS' monthly) with `how`; empty periods dropped."""
+        values = self.dated_values(metric, athletes, start, end)
+        return values.resample(freq).agg(how).dropna(how='all')
+    
+    def week_frame(self, week_num):
+        """Wide Name x Metric DataFrame of one week's values."""
+        self.load_weeks([week_num])
+        return self._week_frames[week_num]
+    
+    def week_stats(self, week_num):
+        """Per-metric min/max/sum/count and team best for one week."""
+        self.load_weeks([week_num])
+        return self._week_stats[week_num]
+    
+    @timed
+    def week_scores(self, week_num):
+        """Precomputed 0-100 scores (Name x Metric) for one week."""
+        self.load_weeks([week_num])
+        return self._week_scores[week_num]
+    
+    @timed
+    def position_aggregates(self, week_num):
+        """Position x Metric aggregates for one week, rebuilt only when the week or roster changes."""
+        self.load_weeks([week_num])
+        return self._position_aggs[week_num]
+    
+    @timed
+    def leaderboard(self, week_num):
+        """Team-wide rank/percentile/change table for one week, cached until it or its previous week changes."""
+        previous_week = max((week for week in self.weeks if week < week_num), default=None)
+        weeks = [week_num] if previous_week is None else [previous_week, week_num]
+        return self._derive(('leaderboard', week_num), weeks, lambda: compute_leaderboard(
+            self._week_frames[week_num],
+            self._week_frames[previous_week] if previous_week is not None else None,
+            self.roster.positions
+        ))
+    
+    def _browse_rows(self):
+        """(week, athlete index, metric values) arrays for every saved athlete-week with at least one value."""
+        weeks = self.weeks
+        n_athletes = len(self.cube.athletes)
+        slots = np.array([self.cube.week_slots[week] for week in weeks], dtype=np.intp)
+        values = self.cube.values[:, slots].transpose(1, 0, 2).reshape(-1, len(self.cube.metrics))
+        recorded = ~np.isnan(values).all(axis=1)
+        week_col = np.repeat(np.array(weeks, dtype=np.int64), n_athletes)[recorded]
+        athlete_col = np.tile(np.arange(n_athletes), len(weeks))[recorded]
+        return week_col, athlete_col, values[recorded]
+    
+    def _browse_order(self, sort_by, descending):
+        """Order of the browse rows for one sort: blank cells last, ties by week, then name."""
+        week_col, athlete_col, values = self._derive('browse rows', self.weeks, self._browse_rows)
+        # Cube rows follow the roster's order, so row i is roster.names[i]
+        athletes = pd.Index(self.roster.names)
+        name_rank = np.argsort(np.argsort(athletes.to_numpy(dtype=str)))[athlete_col]
+        if sort_by == 'Week':
+            primary = week_col
+        elif sort_by == 'Name':
+            primary = name_rank
+        elif sort_by == 'Position':
+            group_order = {position: i for i, position in enumerate(self.roster.position_groups)}
+            primary = self.roster.positions.reindex(athletes).map(group_order).to_numpy()[athlete_col]
+        else:
+            primary = values[:, self.cube.metrics.get_loc(sort_by)]
+        primary = primary.astype('float64') * (-1 if descending else 1)
+        # np.lexsort sorts by the last key first
+        return np.lexsort((name_rank, week_col, primary, np.isnan(primary)))
+    
+    @timed
+    def browse(self, weeks=None, name_query=None, positions=None, sort_by='Week', descending=False, limit=50, offset=0):
+        """One page of Week/Name/Position/metric rows, filtered and sorted here so only the page is copied out.
+        
+        Returns (page DataFrame, total matching rows). The season's rows and each
+        sort order are built once and kept until a week or the roster changes, so a
+        page costs one pass of filter masks over the sorted rows. name_query matches
+        the way the roster search does (see NameIndex.search).
+        """
+        if sort_by not in ['Week', 'Name', 'Position'] + list(self.cube.metrics):
+            raise ValueError(f"Cannot sort by {sort_by!r}")
+        week_col, athlete_col, values = self._derive('browse rows', self.weeks, self._browse_rows)
+        order = self._derive(
+            ('browse order', sort_by, descending), self.weeks, lambda: self._browse_order(sort_by, descending)
+        )
+        athletes = pd.Index(self.roster.names)
+        athlete_positions = self.roster.positions.reindex(athletes)
+        
+        keep = np.ones(len(week_col), dtype=bool)
+        if weeks:
+            keep &= np.isin(week_col, list(weeks))
+        if name_query:
+            keep &= athletes.isin(self.roster.name_index.search(name_query, limit=None))[athlete_col]
+        if positions is not None:
+            keep &= athlete_positions.isin(positions).to_numpy()[athlete_col]
+        rows = order[keep[order]]
+        page_rows = rows[offset:offset + limit]
+        
+        # Shortest decimal form of each float32, as saved: 215.3 and not 215.300003
+        page = pd.DataFrame(values[page_rows].astype(str).astype('float64'), columns=self.cube.metrics)
+        page.insert(0, 'Week', week_col[page_rows])
+        page.insert(1, 'Name', athletes[athlete_col[page_rows]])
+        page.insert(2, 'Position', athlete_positions.to_numpy()[athlete_col[page_rows]])
+        return page, len(rows)
+    
+    def body_weight_baseline(self):
+        """Name -> Week 1 body weight for athletes weighed in Week 1; recomputed only when Week 1 changes."""
+        def compute():
+            if not self.has_week(1) or WEIGHT not in self._week_frames[1]:
+                return pd.Series(dtype='float64', name=WEIGHT)
+            return self._week_frames[1][WEIGHT].dropna()
+        return self._derive('body_weight_baseline', [1], compute)
+    
+    @timed
+    def body_weight_change(self, week_num):
+        """Name -> % body weight change from Week 1 for one week, recomputed only when either week changes."""
+        def compute():
+            baseline = self.body_weight_baseline()
+            frame = self._week_frames.get(week_num)
+            if frame is None or WEIGHT not in frame:
+                return pd.Series(dtype='float64', name=WEIGHT)
+            current = frame[WEIGHT].reindex(baseline.index)
+            return ((current - baseline) / baseline.where(baseline != 0) * 100).dropna()
+        return self._derive(('body_weight_change', week_num), [1, week_num], compute)
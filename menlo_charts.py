@@ -0,0 +1,298 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from collections import OrderedDict
+import threading
+
+from menlo_analytics.downsample import downsample, lttb_indices
+from menlo_analytics.metrics import METRICS
+from menlo_data import current_partition, get_athlete_data_for_week, get_performance_store
+from menlo_profiling import timed
+
+# ============================================================================
+# FIGURE CACHE
+# ============================================================================
+class FigureCache:
+    """Bounded LRU of built Plotly figures, keyed by view and the store revision they were built from."""
+    
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_or_build(self, key, build):
+        """Return the cached figure for key, calling build() on a miss and evicting the least recently used."""
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                return figure
+        
+        figure = build()
+        with self._lock:
+            self._figures[key] = figure
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        return figure
+
+@st.cache_resource
+def get_figure_cache():
+    """Built charts shared across sessions and seasons; entries from older data versions age out of the LRU."""
+    return FigureCache(max_entries=64)
+
+# ============================================================================
+# CHARTS
+# ============================================================================
+# Long series keep at most MAX_LINE_POINTS per line (LTTB keeps the peaks), and
+# charts with more than WEBGL_POINTS points draw with WebGL instead of SVG
+MAX_LINE_POINTS = 500
+WEBGL_POINTS = 1000
+HIGHLIGHT_COLORS = ['#002855', '#DC3545', '#28A745', '#6F42C1', '#FD7E14', '#17A2B8']
+
+def line_trace(n_points):
+    """Scatter for small charts, Scattergl once a chart has more than WEBGL_POINTS points."""
+    return go.Scattergl if n_points > WEBGL_POINTS else go.Scatter
+
+@timed
+def cached_figure(key, build, weeks=None):
+    """Reuse a figure built for the same view and data, building it on first use.
+    
+    Pass the weeks the figure reads so saving an unrelated week keeps it cached.
+    """
+    return get_figure_cache().get_or_build(
+        key + (current_partition(), get_performance_store().revision(weeks)),
+        build
+    )
+
+@timed
+def progress_figure(athlete_name, metric, weeks, values):
+    """Line chart of one athlete's metric across weeks or session dates (a DatetimeIndex).
+    
+    Long series are downsampled to a WebGL line.
+    """
+    dated = isinstance(weeks, pd.DatetimeIndex)
+    fig = go.Figure()
+    
+    if len(values) > MAX_LINE_POINTS:
+        x, y = downsample(weeks, np.asarray(values, dtype='float32'), MAX_LINE_POINTS)
+        fig.add_trace(line_trace(len(values))(
+            x=x, y=y, mode='lines', name=athlete_name, line=dict(color='#002855', width=2)
+        ))
+    else:
+        fig.add_trace(go.Scatter(
+            x=weeks if dated else [f"Week {week}" for week in weeks],
+            y=values,
+            mode='lines+markers',
+            name=athlete_name,
+            line=dict(color='#002855', width=3),
+            marker=dict(size=10, color='#F3C363', line=dict(width=2, color='#002855'))
+        ))
+    
+    fig.update_layout(
+        title=f"{athlete_name} - {metric} Progress",
+        xaxis_title="Date" if dated else "Week",
+        yaxis_title=metric,
+        hovermode='x unified',
+        plot_bgcolor='white',
+        height=500,
+        font=dict(size=14),
+        xaxis=dict(showgrid=True, gridcolor='#E5E5E5'),
+        yaxis=dict(showgrid=True, gridcolor='#E5E5E5')
+    )
+    return fig
+
+@timed
+def group_progress_figure(position, metric, weeks, values, band, highlighted, show_all=True):
+    """A position group's mean ± 1 SD band across weeks or session dates, with highlighted athletes drawn over it.
+    
+    weeks are week numbers or a DatetimeIndex, for the columns of values (the
+    group's athletes x weeks array) and the rows of band. With show_all every
+    athlete is drawn faintly as a single trace (lines split by gaps), so a
+    40-athlete group still serializes as a handful of traces. highlighted maps
+    names to Series on the same axis. Every line is downsampled to MAX_LINE_POINTS.
+    """
+    dated = isinstance(weeks, pd.DatetimeIndex)
+    # Week numbers serialize compactly as float32; dates keep their datetime64 type
+    weeks = weeks.to_numpy() if dated else np.asarray(weeks, dtype='float64')
+    n_points = (values.size if show_all else 0) + 3 * len(band) + sum(len(series) for series in highlighted.values())
+    Line = line_trace(n_points)
+    fig = go.Figure()
+    
+    if show_all:
+        xs, ys = [], []
+        for row in values:
+            x, y = downsample(weeks, row, MAX_LINE_POINTS)
+            if len(x):
+                # A NaN point at the line's last x ends it, so the next athlete starts a new line
+                xs += [x, x[-1:]]
+                ys += [y, [np.nan]]
+        if xs:
+            x = np.concatenate(xs)
+            fig.add_trace(Line(
+                x=x if dated else x.astype('float32'), y=np.concatenate(ys).astype('float32'),
+                mode='lines', name=f"Each {position} athlete", hoverinfo='skip',
+                line=dict(color='rgba(0, 40, 85, 0.15)', width=1)
+            ))
+    
+    # The band is thinned with the mean line's LTTB points so both edges stay aligned
+    band = band[band['count'] > 0]
+    band_x = band.index.to_numpy().astype('int64') if dated else band.index.to_numpy(dtype='float64')
+    keep = lttb_indices(band_x, band['mean'].to_numpy(), MAX_LINE_POINTS)
+    band = band.iloc[keep]
+    spread = band['std'].fillna(0)
+    fig.add_trace(Line(
+        x=band.index, y=band['mean'] + spread, mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'
+    ))
+    fig.add_trace(Line(
+        x=band.index, y=band['mean'] - spread, mode='lines', line=dict(width=0), fill='tonexty',
+        fillcolor='rgba(243, 195, 99, 0.35)', name=f"{position} ± 1 SD", hoverinfo='skip'
+    ))
+    fig.add_trace(Line(
+        x=band.index, y=band['mean'], mode='lines', name=f"{position} Average",
+        line=dict(color='#F3C363', width=3, dash='dash')
+    ))
+    
+    for idx, (athlete, series) in enumerate(highlighted.items()):
+        x, y = downsample(series.index.to_numpy(), series.to_numpy(), MAX_LINE_POINTS)
+        fig.add_trace(Line(
+            x=x, y=y, mode='lines+markers' if Line is go.Scatter else 'lines', name=athlete,
+            line=dict(color=HIGHLIGHT_COLORS[idx % len(HIGHLIGHT_COLORS)], width=3)
+        ))
+    
+    fig.update_layout(
+        title=f"{position} - {metric} Progress",
+        xaxis_title="Date" if dated else "Week",
+        yaxis_title=metric,
+        hovermode='x unified',
+        plot_bgcolor='white',
+        height=500,
+        font=dict(size=14),
+        xaxis=dict(showgrid=True, gridcolor='#E5E5E5'),
+        yaxis=dict(showgrid=True, gridcolor='#E5E5E5')
+    )
+    return fig
+
+@timed
+def radar_figure(athlete_name, position, week_num, categories, athlete_values, position_avg_values, team_best_values):
+    """Athlete vs. position average vs. team best radar chart."""
+    fig = go.Figure()
+    
+    # Athlete
+    fig.add_trace(go.Scatterpolar(
+        r=athlete_values,
+        theta=categories,
+        fill='toself',
+        name=athlete_name,
+        line=dict(color='#002855', width=2),
+        fillcolor='rgba(0, 40, 85, 0.3)'
+    ))
+    
+    # Position Average
+    fig.add_trace(go.Scatterpolar(
+        r=position_avg_values,
+        theta=categories,
+        fill='toself',
+        name=f'{position} Average',
+        line=dict(color='#F3C363', width=2, dash='dash'),
+        fillcolor='rgba(243, 195, 99, 0.2)'
+    ))
+    
+    # Team Best
+    fig.add_trace(go.Scatterpolar(
+        r=team_best_values,
+        theta=categories,
+        fill='toself',
+        name='Team Best',
+        line=dict(color='#28A745', width=2, dash='dot'),
+        fillcolor='rgba(40, 167, 69, 0.1)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=12)
+            )
+        ),
+        showlegend=True,
+        title=f"{athlete_name} Performance Profile - Week {week_num}",
+        height=600,
+        font=dict(size=14)
+    )
+    return fig
+
+@timed
+def head_to_head_figure(athlete_names, week_num):
+    """Overlaid radar traces for 2-4 athletes; has no traces when none of them have data for the week."""
+    # Color palette for multiple athletes
+    colors = ['#002855', '#F3C363', '#DC3545', '#28A745']
+    
+    fig = go.Figure()
+    week_scores = get_performance_store().week_scores(week_num)
+    
+    for idx, athlete in enumerate(athlete_names):
+        athlete_data = get_athlete_data_for_week(athlete, week_num)
+        
+        if athlete_data is not None:
+            categories = []
+            values = []
+            
+            for metric in METRICS:
+                if metric in athlete_data and not pd.isna(athlete_data[metric]):
+                    cat_name = metric.replace(' (lbs)', '').replace(' (seconds)', '').replace(' (inches)', '')
+                    categories.append(cat_name)
+                    
+                    # Normalize
+                    values.append(week_scores.at[athlete, metric])
+            
+            if categories:
+                color = colors[idx % len(colors)]
+                fig.add_trace(go.Scatterpolar(
+                    r=values,
+                    theta=categories,
+                    fill='toself',
+                    name=athlete,
+                    line=dict(color=color, width=2),
+                    fillcolor=f'rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.2)'
+                ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=12)
+            )
+        ),
+        showlegend=True,
+        title=f"Head-to-Head Comparison - Week {week_num}",
+        height=600,
+        font=dict(size=14)
+    )
+    return fig
+
+@timed
+def weight_trend_figure(week_labels, weights):
+    """Compact body weight line chart for the Player Card."""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=week_labels,
+        y=weights,
+        mode='lines+markers',
+        line=dict(color='#002855', width=2),
+        marker=dict(size=8, color='#F3C363')
+    ))
+    
+    fig.update_layout(
+        title="Body Weight Progress",
+        xaxis_title="Week",
+        yaxis_title="Weight (lbs)",
+        height=300,
+        plot_bgcolor='white',
+        xaxis=dict(showgrid=True, gridcolor='#E5E5E5'),
+        yaxis=dict(showgrid=True, gridcolor='#E5E5E5')
+    )
+    return fig
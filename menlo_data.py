@@ -0,0 +1,164 @@
+import streamlit as st
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
+
+from menlo_analytics import reports
+from menlo_analytics.config import DB_PATH, DEFAULT_TEAM, ROSTER_PATH
+from menlo_analytics.database import SeasonDatabase
+from menlo_analytics.ingest import ingest_week, read_season, read_table, validate_season_upload
+from menlo_analytics.roster import load_roster
+from menlo_analytics.store import PerformanceStore
+from menlo_profiling import timed
+
+# Streamlit side of the data layer: the process-wide stores, background upload parsing
+# and the store-bound helpers pages call. The logic itself lives in menlo_analytics.
+
+# ============================================================================
+# SHARED DATA
+# ============================================================================
+@st.cache_resource
+def get_database():
+    """Handle on the whole database file, for listing its teams and seasons."""
+    return SeasonDatabase(DB_PATH)
+
+def default_season():
+    """MENLO_SEASON, or the default team's latest saved season; looked up each time, so it follows new seasons."""
+    return get_database().default_season(DEFAULT_TEAM)
+
+def list_partitions():
+    """Sorted (team, season) pairs saved in the database, plus the default one."""
+    return sorted(set(get_database().partitions()) | {(DEFAULT_TEAM, default_season())})
+
+def current_partition():
+    """(team, season) picked in this session's sidebar, or the defaults before the picker runs."""
+    if 'season' in st.session_state:
+        return st.session_state.get('team', DEFAULT_TEAM), st.session_state.season
+    return st.session_state.get('team', DEFAULT_TEAM), default_season()
+
+@st.cache_resource(max_entries=8)
+def get_partition_store(team, season):
+    """One roster and performance store per team and season, shared by every coach session.
+    
+    A store is only built when someone opens its season, so other teams and past
+    seasons in the file cost nothing to the views that do not use them.
+    """
+    database = SeasonDatabase(DB_PATH, team, season)
+    # roster.csv belongs to the default team and season; the others use the roster saved for them
+    roster_path = ROSTER_PATH if database.is_default_partition() else None
+    return PerformanceStore(load_roster(roster_path, database), database=database)
+
+def get_performance_store():
+    """The store for the team and season picked in this session."""
+    return get_partition_store(*current_partition())
+
+# ============================================================================
+# BACKGROUND UPLOAD PARSING
+# ============================================================================
+class ParseJob:
+    """One uploaded file parsed on a worker thread; the page polls it and may cancel it."""
+    
+    def __init__(self, executor, read, file_name, file_bytes):
+        self.file_name = file_name
+        self.fraction, self.text = 0.0, f"Waiting to read {file_name}"
+        self.cancel_event = threading.Event()
+        self.future = executor.submit(read, file_name, file_bytes, self._on_progress, self.cancel_event)
+    
+    def _on_progress(self, fraction, text):
+        self.fraction, self.text = fraction, text
+    
+    def cancel(self):
+        self.cancel_event.set()
+        self.future.cancel()
+    
+    def wait(self, timeout):
+        """True once parsing has finished (or failed), waiting up to timeout seconds."""
+        return not wait([self.future], timeout=timeout).not_done
+
+class ParseJobs:
+    """Parse jobs keyed by file content, so a file uploaded again (or by another coach) is parsed once.
+    
+    Finished jobs stay as a small LRU of results, like a parse cache; cancelled
+    ones are dropped so the next request starts over.
+    """
+    
+    def __init__(self, max_workers=2, max_finished=8):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='menlo-parse')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_finished = max_finished
+    
+    def start(self, read, file_name, content_hash, file_bytes):
+        """The job parsing this content with read(file_name, bytes, on_progress, cancel), started if needed."""
+        key = (read.__name__, file_name, content_hash)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.cancel_event.is_set():
+                job = self._jobs[key] = ParseJob(self._executor, read, file_name, file_bytes)
+            self._jobs.move_to_end(key)
+            finished = [k for k, j in self._jobs.items() if j.future.done()]
+            for k in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[k]
+        return job
+
+@st.cache_resource
+def get_parse_jobs():
+    """Upload parsing shared by every session; two workers, so a large file never holds up the others for long."""
+    return ParseJobs()
+
+@timed
+def start_upload_parse(file_name, content_hash, file_bytes):
+    """Parse one weekly CSV/Excel/Parquet/Feather upload in the background."""
+    return get_parse_jobs().start(read_table, file_name, content_hash, file_bytes)
+
+@timed
+def start_season_parse(file_name, content_hash, file_bytes):
+    """Parse a season workbook, ZIP or single-table export in the background."""
+    return get_parse_jobs().start(read_season, file_name, content_hash, file_bytes)
+
+# Validation runs once per file content and store state, not on every rerun while a
+# file is staged; the parsed frames and the store are left out of the cache key.
+def validate_week_upload(content_hash, df):
+    """ingest_week() of a parsed weekly upload against the current roster: (clean_df, issues_df)."""
+    store = get_performance_store()
+    return _validate_week_upload(content_hash, *current_partition(), store.revision([]), df, store)
+
+@st.cache_resource(max_entries=8)
+def _validate_week_upload(content_hash, team, season, roster_revision, _df, _store):
+    return ingest_week(_df, _store.roster)
+
+def validate_season_file(content_hash, frames):
+    """validate_season_upload() of a parsed season file against the current roster and saved sessions."""
+    store = get_performance_store()
+    return _validate_season_file(content_hash, *current_partition(), store.revision(), frames, store)
+
+@st.cache_resource(max_entries=8)
+def _validate_season_file(content_hash, team, season, store_revision, _frames, _store):
+    return validate_season_upload(_frames, _store.roster, _store.session_dates, max(_store.weeks, default=0) + 1)
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+def normalize_metric(value, metric_name, week_num):
+    """Normalize metrics to 0-100 scale using the week's stats. Invert for Sprint (lower is better)."""
+    return reports.normalize_metric(get_performance_store(), value, metric_name, week_num)
+
+def get_athlete_data_for_week(athlete_name, week_num):
+    """Get athlete metrics for a specific week."""
+    return get_performance_store().athlete_week(athlete_name, week_num)
+
+def calculate_body_weight_change(athlete_name, current_week):
+    """Calculate % change in body weight from Week 1 to current week."""
+    return reports.calculate_body_weight_change(get_performance_store(), athlete_name, current_week)
+
+def get_position_average(position, week_num, metric):
+    """Calculate average metric for a position group."""
+    return reports.get_position_average(get_performance_store(), position, week_num, metric)
+
+def get_team_best(week_num, metric):
+    """Get team best for a metric."""
+    return reports.get_team_best(get_performance_store(), week_num, metric)
+
+def build_player_cards(start_week, end_week):
+    """Plain-data Player Card payloads for every rostered athlete with data in both weeks."""
+    return reports.build_player_cards(get_performance_store(), start_week, end_week)
@@ -0,0 +1,61 @@
+import streamlit as st
+import pandas as pd
+from collections import deque
+import os
+
+from menlo_analytics.profiling import ENABLED, finish_run, section, start_run, timed
+
+__all__ = ['ENABLED', 'section', 'timed', 'start_rerun', 'finish_rerun', 'render_panel']
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Timers live in menlo_analytics.profiling (MENLO_PROFILE=1, MENLO_PROFILE_LOG);
+# this module adds the per-session history and the sidebar panel.
+
+# Reruns kept per session for the sidebar panel
+HISTORY = int(os.environ.get("MENLO_PROFILE_HISTORY", "20"))
+
+# ============================================================================
+# RERUN RECORDS
+# ============================================================================
+def start_rerun():
+    """Begin collecting timings for this script run."""
+    start_run()
+
+def finish_rerun(page):
+    """Close this run's record, keep the last HISTORY in the session and show the panel.
+    
+    Runs cut short by st.rerun() or st.stop() never reach here and are not recorded.
+    """
+    record = finish_run(page)
+    if record is None:
+        return
+    
+    history = st.session_state.setdefault('profiling_history', deque(maxlen=HISTORY))
+    history.append(record)
+    render_panel(history)
+
+def render_panel(history):
+    """Sidebar breakdown of the latest rerun and totals for the recent ones."""
+    latest = history[-1]
+    with st.sidebar.expander("⏱️ Profiling", expanded=False):
+        st.markdown(f"**Last rerun:** {latest['page']} • {latest['total_ms']:.1f} ms")
+        
+        breakdown = pd.DataFrame(
+            [(label, stats['calls'], stats['ms']) for label, stats in latest['sections'].items()],
+            columns=['Section', 'Calls', 'ms']
+        ).sort_values('ms', ascending=False)
+        st.dataframe(breakdown, use_container_width=True, hide_index=True)
+        
+        st.markdown(f"**Last {len(history)} reruns**")
+        recent = pd.DataFrame([
+            {
+                'Time': record['time'][11:],
+                'Page': record['page'],
+                'Total ms': record['total_ms'],
+                'Calls': sum(stats['calls'] for stats in record['sections'].values())
+            }
+            for record in reversed(history)
+        ])
+        st.dataframe(recent, use_container_width=True, hide_index=True)
@@ -0,0 +1,51 @@
+import streamlit as st
+import math
+
+from menlo_profiling import section
+
+# ============================================================================
+# PAGINATED TABLES
+# ============================================================================
+# Only the visible page is sent to the browser. Sorting and filtering happen in
+# the data source: the PerformanceStore for saved weeks, pandas for small frames.
+def frame_source(df):
+    """fetch(sort_by, descending, limit, offset) over an in-memory DataFrame, for paginated_table."""
+    def fetch(sort_by, descending, limit, offset):
+        ordered = df.sort_values(sort_by, ascending=not descending, na_position='last', kind='stable')
+        return ordered.iloc[offset:offset + limit], len(df)
+    return fetch
+
+def paginated_table(key, fetch, sort_columns, page_sizes=(25, 50, 100), **dataframe_args):
+    """Sort, page size and page controls over one page of rows; returns the total row count.
+    
+    fetch(sort_by, descending, limit, offset) must return (page DataFrame, total rows).
+    Widget state is kept under `key`, so each table remembers its own sort and page.
+    """
+    col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+    
+    with col1:
+        sort_by = st.selectbox("Sort by", options=sort_columns, key=f"{key}_sort")
+    with col2:
+        descending = st.toggle("Descending", key=f"{key}_descending")
+    with col3:
+        page_size = st.selectbox("Rows per page", options=page_sizes, key=f"{key}_page_size")
+    
+    # Filters or a smaller page size can leave the remembered page past the end
+    page_key = f"{key}_page"
+    page = st.session_state.get(page_key, 1)
+    with section(f"{key} fetch"):
+        rows, total = fetch(sort_by, descending, page_size, (page - 1) * page_size)
+    n_pages = max(1, math.ceil(total / page_size))
+    if page > n_pages:
+        page = st.session_state[page_key] = n_pages
+        with section(f"{key} fetch"):
+            rows, total = fetch(sort_by, descending, page_size, (page - 1) * page_size)
+    
+    with col4:
+        st.number_input(f"Page (of {n_pages:,})", min_value=1, max_value=n_pages, step=1, key=page_key)
+    
+    first = (page - 1) * page_size + 1 if total else 0
+    st.caption(f"Rows {first:,}–{first + len(rows) - 1 if total else 0:,} of {total:,}")
+    with section(f"{key} render"):
+        st.dataframe(rows, hide_index=True, use_container_width=True, **dataframe_args)
+    return total
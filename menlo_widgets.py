@@ -0,0 +1,74 @@
+import streamlit as st
+import hashlib
+
+# ============================================================================
+# ATHLETE PICKERS
+# ============================================================================
+# A search box above the picker narrows its options to the roster's ranked name
+# matches, so a large roster is not sent to the browser in full on every rerun
+# and accented or reordered spellings still find the athlete.
+MAX_MATCHES = 50
+
+def _options(label, roster, key, keep=(), help=None):
+    """Search box labelled as the picker; returns the options to offer under it."""
+    query = st.text_input(label, key=f"{key}_search", placeholder="Type a name to search", help=help)
+    if not query:
+        return roster.sorted_names
+    matches = roster.name_index.search(query, limit=MAX_MATCHES)
+    if not matches:
+        st.caption(f"No athletes match '{query}'")
+    return list(keep) + [name for name in matches if name not in keep]
+
+def athlete_picker(label, roster, key, help=None, **selectbox_args):
+    """Selectbox of roster names with a search box that narrows it to the best matches; returns the chosen name."""
+    current = st.session_state.get(key)
+    options = _options(label, roster, key, help=help) or roster.sorted_names
+    # Stay on the chosen athlete while they still match; otherwise take the best match
+    index = options.index(current) if current in options else 0
+    return st.selectbox(label, options=options, index=index, key=key, label_visibility="collapsed", **selectbox_args)
+
+def athletes_picker(label, roster, key, help=None, **multiselect_args):
+    """Multiselect of roster names with a search box; athletes already chosen stay listed while searching."""
+    selected = [name for name in st.session_state.get(key, []) if name in roster]
+    options = _options(label, roster, key, keep=selected, help=help)
+    return st.multiselect(label, options=options, key=key, label_visibility="collapsed", **multiselect_args)
+
+# ============================================================================
+# BACKGROUND UPLOAD PARSING
+# ============================================================================
+# A file that parses within FIRST_WAIT_SECONDS shows no progress bar at all;
+# a larger one is polled by a fragment, so only the bar reruns until it is done.
+FIRST_WAIT_SECONDS = 0.2
+POLL_SECONDS = 0.5
+
+def parsed_upload(uploaded_file, start, key):
+    """(parsed upload, content hash), or None while it is parsing (a progress bar and Cancel button show meanwhile).
+    
+    start(file_name, content_hash, file_bytes) returns the background ParseJob.
+    The hash keys anything derived from the parsed file, such as its validation.
+    Parse errors are raised here, in the script thread, like a direct read.
+    """
+    file_bytes = uploaded_file.getvalue()
+    content_hash = hashlib.sha256(file_bytes).hexdigest()
+    cancelled_key = f"{key}_cancelled"
+    if st.session_state.get(cancelled_key) == content_hash:
+        st.info(f"ℹ️ Reading {uploaded_file.name} was cancelled.")
+        st.button("🔄 Read Again", key=f"{key}_restart", on_click=st.session_state.pop, args=(cancelled_key,))
+        return None
+    
+    job = start(uploaded_file.name, content_hash, file_bytes)
+    if job.wait(FIRST_WAIT_SECONDS):
+        return job.future.result(), content_hash
+    
+    @st.fragment(run_every=POLL_SECONDS)
+    def parse_progress():
+        if job.future.done():
+            st.rerun()
+        st.progress(min(job.fraction, 1.0), text=job.text)
+        if st.button("✖️ Cancel", key=f"{key}_cancel"):
+            job.cancel()
+            st.session_state[cancelled_key] = content_hash
+            st.rerun()
+    
+    parse_progress()
+    return None
@@ -0,0 +1,29 @@
+import io
+import zipfile
+
+import pandas as pd
+
+from menlo_analytics.cards import card_filename
+from menlo_analytics.reports import build_player_cards, export_player_cards
+from menlo_analytics.roster import Roster
+from menlo_analytics.store import PerformanceStore
+
+def test_card_filename_keeps_accents_readable():
+    assert card_filename('Jaramillo-López, Tomás', 12, 'html') == 'jaramillo_lopez_tomas_12.html'
+    assert card_filename("O'Neil, D.J.", 3, 'pdf') == 'o_neil_d_j_3.pdf'
+
+def test_namesakes_get_separate_cards():
+    roster = Roster(pd.DataFrame({
+        'Athlete ID': [1, 2],
+        'Name': ['López, Tomás', 'Lopez, Tomas'],
+        'Position': ['Skill', 'Line']
+    }), ['Skill', 'Line'])
+    store = PerformanceStore(roster)
+    store.save_weeks({
+        1: pd.DataFrame({'Name': roster.names, 'Bench Press (lbs)': [185.0, 225.0]}),
+        2: pd.DataFrame({'Name': roster.names, 'Bench Press (lbs)': [190.0, 230.0]}),
+    })
+    
+    cards = build_player_cards(store, 1, 2)
+    with zipfile.ZipFile(io.BytesIO(export_player_cards(cards))) as archive:
+        assert sorted(archive.namelist()) == ['lopez_tomas_1.html', 'lopez_tomas_2.html']
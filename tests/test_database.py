@@ -0,0 +1,189 @@
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+import pytest
+
+from menlo_analytics import database as database_module
+from menlo_analytics.config import DEFAULT_TEAM
+from menlo_analytics.database import SeasonDatabase
+from menlo_analytics.roster import Roster
+from menlo_analytics.store import PerformanceStore
+
+# Single-season schemas as they were written before seasons existed
+USER_004_SCHEMA = """
+    CREATE TABLE weeks (
+        week INTEGER PRIMARY KEY,
+        record_count INTEGER NOT NULL,
+        saved_at TEXT NOT NULL
+    );
+    CREATE TABLE performance (
+        week INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        value REAL,
+        PRIMARY KEY (week, name, metric)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_performance_athlete ON performance (name, metric, week);
+"""
+USER_014_SCHEMA = USER_004_SCHEMA + """
+    CREATE TABLE roster (
+        athlete_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        position TEXT NOT NULL
+    );
+"""
+# Team and season partitions with values keyed by name, as saved before Athlete IDs were stored
+NAME_KEYED_SCHEMA = """
+    CREATE TABLE weeks (
+        team TEXT NOT NULL, season TEXT NOT NULL, week INTEGER NOT NULL, record_count INTEGER NOT NULL,
+        saved_at TEXT NOT NULL, session_date TEXT, PRIMARY KEY (team, season, week)
+    );
+    CREATE TABLE performance (
+        team TEXT NOT NULL, season TEXT NOT NULL, week INTEGER NOT NULL, name TEXT NOT NULL,
+        metric TEXT NOT NULL, value REAL, PRIMARY KEY (team, season, week, name, metric)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_performance_athlete ON performance (team, season, name, metric, week);
+    CREATE TABLE roster (
+        team TEXT NOT NULL, season TEXT NOT NULL, athlete_id INTEGER NOT NULL, name TEXT NOT NULL,
+        position TEXT NOT NULL, PRIMARY KEY (team, season, athlete_id), UNIQUE (team, season, name)
+    );
+    CREATE TABLE teams (team TEXT PRIMARY KEY, position_groups TEXT NOT NULL);
+"""
+ROSTER_DF = pd.DataFrame({'Athlete ID': [1, 2], 'Name': ['Doe, Jane', 'Roe, Sam'], 'Position': ['Skill', 'Line']})
+
+@pytest.fixture(autouse=True)
+def no_season_override(monkeypatch):
+    monkeypatch.setattr(database_module, 'DEFAULT_SEASON', None)
+
+def legacy_file(path, schema):
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executescript(schema)
+        conn.executemany(
+            "INSERT INTO weeks VALUES (?, ?, ?)",
+            [(1, 2, '2024-08-12T09:00:00.000000'), (2, 1, '2024-08-19T09:00:00.000000')]
+        )
+        conn.executemany(
+            "INSERT INTO performance VALUES (?, ?, ?, ?)",
+            [(1, 'Doe, Jane', 'Bench Press (lbs)', 185.0), (1, 'Roe, Sam', 'Bench Press (lbs)', 225.0),
+             (2, 'Doe, Jane', 'Bench Press (lbs)', 190.0)]
+        )
+        if 'CREATE TABLE roster' in schema:
+            conn.executemany(
+                "INSERT INTO roster VALUES (?, ?, ?)", [(1, 'Doe, Jane', 'Skill'), (2, 'Roe, Sam', 'Line')]
+            )
+    return path
+
+def table_names(path):
+    with closing(sqlite3.connect(path)) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+def test_migrates_file_without_roster_table(tmp_path):
+    path = legacy_file(str(tmp_path / 'season.db'), USER_004_SCHEMA)
+    
+    db = SeasonDatabase(path)
+    
+    assert (db.team, db.season) == (DEFAULT_TEAM, '2024')
+    assert db.saved_weeks() == {1: 2, 2: 1}
+    assert db.load_roster().empty
+    assert not any(name.endswith('_single_season') for name in table_names(path))
+    # Values were saved by name: they wait for a roster to give them Athlete IDs
+    assert db.load_weeks([1])[1].empty
+    
+    db.save_roster(ROSTER_DF)
+    
+    assert db.load_weeks([1])[1]['Athlete ID'].tolist() == [1, 2]
+    assert db.load_weeks([1])[1]['Value'].tolist() == pytest.approx([185.0, 225.0])
+    # Reopening finds the migrated data in place
+    assert SeasonDatabase(path).load_weeks([2])[2]['Value'].tolist() == pytest.approx([190.0])
+
+def test_migrates_file_with_roster_table(tmp_path):
+    path = legacy_file(str(tmp_path / 'season.db'), USER_014_SCHEMA)
+    
+    db = SeasonDatabase(path)
+    
+    assert db.load_roster()['Name'].tolist() == ['Doe, Jane', 'Roe, Sam']
+    assert db.saved_weeks() == {1: 2, 2: 1}
+    assert db.load_weeks([1])[1]['Athlete ID'].tolist() == [1, 2]
+
+def test_finishes_interrupted_migration(tmp_path):
+    # What an earlier migration left behind: renamed legacy tables next to new, empty ones
+    path = legacy_file(str(tmp_path / 'season.db'), USER_004_SCHEMA)
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute("DROP INDEX idx_performance_athlete")
+        conn.execute("ALTER TABLE weeks RENAME TO weeks_single_season")
+        conn.execute("ALTER TABLE performance RENAME TO performance_single_season")
+        conn.executescript(SeasonDatabase.SCHEMA)
+    
+    db = SeasonDatabase(path)
+    
+    assert db.saved_weeks() == {1: 2, 2: 1}
+    assert not any(name.endswith('_single_season') for name in table_names(path))
+
+def test_failed_migration_leaves_file_unchanged(tmp_path, monkeypatch):
+    path = legacy_file(str(tmp_path / 'season.db'), USER_004_SCHEMA)
+    before = table_names(path)
+    monkeypatch.setattr(SeasonDatabase, 'SCHEMA', SeasonDatabase.SCHEMA + "; CREATE TABLE broken (")
+    
+    with pytest.raises(sqlite3.OperationalError):
+        SeasonDatabase(path)
+    
+    assert table_names(path) == before
+    with closing(sqlite3.connect(path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM performance").fetchone()[0] == 3
+
+def test_default_season_follows_saved_data(tmp_path, monkeypatch):
+    path = str(tmp_path / 'season.db')
+    roster_df = pd.DataFrame({'Athlete ID': [1], 'Name': ['Doe, Jane'], 'Position': ['Skill']})
+    for team, season in ((DEFAULT_TEAM, '2024'), (DEFAULT_TEAM, '2025'), ('Soccer', '2031')):
+        SeasonDatabase(path, team, season).save_roster(roster_df)
+    
+    # The latest saved season, whatever the calendar says
+    assert SeasonDatabase(path).season == '2025'
+    assert SeasonDatabase(path, 'Soccer').season == '2031'
+    
+    monkeypatch.setattr(database_module, 'DEFAULT_SEASON', '2024')
+    assert SeasonDatabase(path).season == '2024'
+
+def test_keys_name_keyed_values_by_athlete_id(tmp_path):
+    path = str(tmp_path / 'season.db')
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executescript(NAME_KEYED_SCHEMA)
+        conn.execute("INSERT INTO weeks VALUES ('Football', '2025', 1, 3, '2025-08-12T09:00:00', NULL)")
+        conn.executemany(
+            "INSERT INTO performance VALUES ('Football', '2025', 1, ?, 'Bench Press (lbs)', ?)",
+            [('Doe, Jane', 185.0), ('Roe, Sam', 225.0), ('Gone, Al', 150.0)]
+        )
+        conn.executemany(
+            "INSERT INTO roster VALUES ('Football', '2025', ?, ?, ?)", [(1, 'Doe, Jane', 'Skill'), (2, 'Roe, Sam', 'Line')]
+        )
+    
+    db = SeasonDatabase(path, 'Football', '2025')
+    
+    assert db.load_weeks([1])[1]['Athlete ID'].tolist() == [1, 2]
+    # A name not on the roster is kept until a roster has it
+    with closing(sqlite3.connect(path)) as conn:
+        assert conn.execute("SELECT name FROM unmatched_performance").fetchall() == [('Gone, Al',)]
+    
+    db.save_roster(pd.concat([ROSTER_DF, pd.DataFrame({'Athlete ID': [3], 'Name': ['Gone, Al'], 'Position': ['Line']})]))
+    
+    assert db.load_weeks([1])[1]['Athlete ID'].tolist() == [1, 2, 3]
+    
+    # Saving the week again replaces every value it had, including any still unmatched
+    db.save_weeks({1: pd.DataFrame({'Athlete ID': [1], 'Metric': ['Bench Press (lbs)'], 'Value': [190.0]})}, {1: 1})
+    assert db.load_weeks([1])[1]['Athlete ID'].tolist() == [1]
+
+def test_renamed_athlete_keeps_history(tmp_path):
+    db = SeasonDatabase(str(tmp_path / 'season.db'), 'Football', '2025')
+    db.save_roster(ROSTER_DF)
+    store = PerformanceStore(Roster(ROSTER_DF), database=db)
+    store.save_weeks({1: pd.DataFrame({'Name': ['Doe, Jane', 'Roe, Sam'], 'Bench Press (lbs)': [185.0, 225.0]})})
+    
+    # Same Athlete ID, corrected spelling
+    renamed = ROSTER_DF.replace({'Doe, Jane': 'Doe, Janet'})
+    db.save_roster(renamed)
+    store.set_roster(Roster(renamed))
+    
+    assert store.get('Doe, Janet', 1, 'Bench Press (lbs)') == pytest.approx(185.0)
+    reopened = PerformanceStore(Roster(db.load_roster()), database=SeasonDatabase(db.path, 'Football', '2025'))
+    assert reopened.athlete_series('Doe, Janet', 'Bench Press (lbs)').tolist() == pytest.approx([185.0])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from menlo_analytics.downsample import downsample, lttb_indices
+
+X = np.arange(10.0)
+Y = np.array([0.0, 1.0, 0.0, 9.0, 0.0, 1.0, 0.0, -7.0, 0.0, 1.0])
+
+@pytest.mark.parametrize('n_out', [10, 20])
+def test_short_line_is_kept_whole(n_out):
+    assert lttb_indices(X, Y, n_out).tolist() == list(range(10))
+
+@pytest.mark.parametrize('n_out', [0, 1, 2])
+def test_fewer_than_three_points_keeps_everything(n_out):
+    # Two points cannot hold a bucket between first and last
+    assert lttb_indices(X, Y, n_out).tolist() == list(range(10))
+
+def test_keeps_first_last_and_peaks():
+    assert lttb_indices(X, Y, 5).tolist() == [0, 2, 3, 7, 9]
+    assert lttb_indices(X, Y, 3).tolist() == [0, 3, 9]
+    
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=5000)
+    y[1234], y[4321] = 50.0, -50.0
+    keep = lttb_indices(np.arange(5000), y, 200)
+    
+    assert len(keep) == 200
+    assert keep[0] == 0 and keep[-1] == 4999
+    assert (np.diff(keep) > 0).all()
+    assert {1234, 4321} <= set(keep.tolist())
+
+def test_downsample_skips_nan_gaps():
+    y = Y.copy()
+    y[[3, 4]] = np.nan
+    
+    x_out, y_out = downsample(X, y, 100)
+    assert x_out.tolist() == [0.0, 1.0, 2.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+    
+    x_out, y_out = downsample(X, y, 5)
+    assert x_out.tolist() == [0.0, 1.0, 5.0, 7.0, 9.0]
+    assert not np.isnan(y_out).any()
+    
+    x_out, y_out = downsample(X, np.full(10, np.nan), 5)
+    assert len(x_out) == len(y_out) == 0
+
+def test_downsample_dates():
+    dates = np.arange('2025-08-01', '2025-08-11', dtype='datetime64[D]').astype('datetime64[ns]')
+    
+    x_out, y_out = downsample(dates, Y, 4)
+    
+    assert x_out.dtype == dates.dtype
+    assert x_out.tolist() == dates[[0, 3, 7, 9]].tolist()
+    assert y_out.tolist() == [0.0, 9.0, -7.0, 1.0]
@@ -0,0 +1,115 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from menlo_analytics.ingest import UNKEYED_ROWS, ingest_week, parse_session_label, read_season, validate_season_upload
+from menlo_analytics.roster import Roster
+from menlo_analytics.store import PerformanceStore
+
+ROSTER = Roster(
+    pd.DataFrame({'Athlete ID': [1, 2], 'Name': ['Doe, Jane', 'Roe, Sam'], 'Position': ['Skill', 'Line']}),
+    ['Skill', 'Line']
+)
+
+# A device export: one table, many sessions, some rows with keys that place them nowhere
+DEVICE_EXPORT = b"""Week,Date,Name,Bench Press (lbs)
+1,2025-08-14,"Doe, Jane",185
+1,2025-08-14,"Roe, Sam",heavy
+2,,"Doe, Jane",190
+1.5,2025-08-20,"Doe, Jane",195
+,2025-08-21,"Roe, Sam",230
+2,someday,"Roe, Sam",235
+2,,"Nobody, Al",200
+"""
+
+def test_split_sessions_keeps_file_rows():
+    frames = read_season('device.csv', DEVICE_EXPORT)
+    
+    assert list(frames) == ['Week 1 2025-08-14', 'Week 2', UNKEYED_ROWS]
+    
+    week_dfs, session_dates, problems, issues_df = validate_season_upload(frames, ROSTER)
+    
+    assert sorted(week_dfs) == [1, 2]
+    assert session_dates == {1: pd.Timestamp('2025-08-14')}
+    # Row numbers are spreadsheet rows of the whole file, counting the header
+    assert sorted(zip(issues_df['Row'], issues_df['Name'])) == [(3, 'Roe, Sam'), (8, 'Nobody, Al')]
+    assert problems == ['Rows 5, 6, 7: blank or invalid Week or Date (weeks are whole numbers)']
+
+def test_split_sessions_by_date_only():
+    frames = read_season('device.csv', b'Date,Name,Bench Press (lbs)\n2025-08-14,"Doe, Jane",185\n,"Roe, Sam",225\n')
+    
+    assert frames['2025-08-14'].index.tolist() == [0]
+    assert frames[UNKEYED_ROWS].index.tolist() == [1]
+
+def test_saved_week_is_keyed_by_resolved_athlete_id():
+    upload = pd.DataFrame({'Name': ['jane doe', 'Roe, Sam'], 'Bench Press (lbs)': [185.0, 225.0]})
+    clean_df, _ = ingest_week(upload, ROSTER)
+    
+    # The roster is corrected between validating and saving: the ID still finds the athlete
+    store = PerformanceStore(Roster(ROSTER.frame.replace({'Doe, Jane': 'Doe, Janet'})))
+    store.save_week(1, clean_df)
+    
+    assert clean_df['Athlete ID'].tolist() == [1, 2]
+    assert store.get('Doe, Janet', 1, 'Bench Press (lbs)') == 185.0
+
+def test_split_sessions_keeps_timed_sessions_apart():
+    export = b"""Date,Name,Bench Press (lbs)
+2025-08-14 07:00,"Doe, Jane",185
+2025-08-14 07:00,"Roe, Sam",225
+2025-08-14 15:30,"Doe, Jane",190
+2025-08-14 15:30,"Roe, Sam",230
+"""
+    frames = read_season('device.csv', export)
+    
+    assert list(frames) == ['2025-08-14 07:00:00', '2025-08-14 15:30:00']
+    
+    week_dfs, session_dates, problems, issues_df = validate_season_upload(frames, ROSTER)
+    
+    assert problems == [] and issues_df.empty
+    assert week_dfs[1]['Bench Press (lbs)'].tolist() == [185.0, 225.0]
+    assert week_dfs[2]['Bench Press (lbs)'].tolist() == [190.0, 230.0]
+    assert session_dates == {1: pd.Timestamp('2025-08-14'), 2: pd.Timestamp('2025-08-14')}
+    
+    # Importing the same file again replaces those two sessions, in time order
+    week_dfs, _, _, _ = validate_season_upload(frames, ROSTER, session_dates, 3)
+    assert sorted(week_dfs) == [1, 2]
+
+@pytest.mark.parametrize('label, expected', [
+    ('football_2025_week3.csv', (3, None)),
+    ('FB25 Week 4.csv', (4, None)),
+    ('week_03.csv', (3, None)),
+    ('wk-2.xlsx', (2, None)),
+    ('Sheet1', (1, None)),
+    ('Week 3 2025-08-14', (3, pd.Timestamp('2025-08-14'))),
+    ('2025-08-14 pm.csv', (None, pd.Timestamp('2025-08-14'))),
+])
+def test_parse_session_label(label, expected):
+    assert parse_session_label(label) == expected
+
+@pytest.mark.parametrize('label, problem', [
+    ('Week -2', 'cannot be negative'),
+    ('2025.csv', 'looks like a year'),
+    ('Week 2025', 'looks like a year'),
+    ('FB25 4.csv', 'more than one number'),
+    ('2025-02-30.csv', 'not a valid date'),
+])
+def test_parse_session_label_rejects(label, problem):
+    with pytest.raises(ValueError, match=problem):
+        parse_session_label(label)
+    frames = {label: pd.DataFrame({'Name': ['Doe, Jane'], 'Bench Press (lbs)': [185.0]})}
+    assert problem in validate_season_upload(frames, ROSTER)[2][0]
+
+def test_empty_zip_lists_accepted_inputs():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('notes.txt', 'week 1')
+    
+    week_dfs, _, problems, _ = validate_season_upload(read_season('season.zip', buffer.getvalue()), ROSTER)
+    
+    assert week_dfs == {}
+    assert problems == [
+        "No weeks found: expected a workbook with one sheet per week, weekly CSV, XLSX, PARQUET, FEATHER, ARROW files "
+        "in a ZIP or folder, or one table with a Week or Date column"
+    ]
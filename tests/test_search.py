@@ -0,0 +1,44 @@
+import pytest
+
+from menlo_analytics.search import NameIndex, normalize_name
+
+NAMES = [
+    'López, Tomás', 'Lopez, Maria', 'Jaramillo-López, Tomás', 'Torres, Tomas',
+    'Smith, Ben', 'Smith, Anna', 'Anna Smith', 'Smithers, Ann', 'Smyth, Ana', 'Johnson, Mike',
+]
+INDEX = NameIndex(NAMES)
+
+def test_normalize_name():
+    assert normalize_name('Jaramillo-López, Tomás') == 'jaramillo lopez tomas'
+    assert normalize_name('  SMITH,ben ') == 'smith ben'
+
+@pytest.mark.parametrize('name, expected', [
+    ('Tomas Lopez', 'López, Tomás'),
+    ('tomás  LÓPEZ', 'López, Tomás'),
+    ('Smith Ben', 'Smith, Ben'),
+    # 'Smith, Anna' and 'Anna Smith' have the same words, so neither is picked
+    ('anna smith', None),
+    ('Tomas', None),
+])
+def test_resolve(name, expected):
+    assert INDEX.resolve(name) == expected
+
+def test_search_ranks_prefix_matches_alphabetically():
+    # Name prefix first, then word prefixes; ties are alphabetical by normalized name
+    assert INDEX.search('lopez') == ['Lopez, Maria', 'López, Tomás', 'Jaramillo-López, Tomás']
+    assert INDEX.search('smith ann') == ['Smith, Anna', 'Anna Smith', 'Smithers, Ann', 'Smith, Ben', 'Smyth, Ana']
+    assert INDEX.search('t lop') == ['Jaramillo-López, Tomás', 'López, Tomás']
+
+def test_search_typo_uses_trigram_fallback():
+    # No word starts with 'jonhson' or 'smtih'; shared trigrams still find the athlete
+    assert INDEX.search('jonhson') == ['Johnson, Mike']
+    assert INDEX.search('Smtih Ben') == ['Smith, Ben']
+    assert INDEX.closest('Jonson, Mike') == 'Johnson, Mike'
+    assert INDEX.closest('Zzyzx, Q') is None
+
+def test_search_limit():
+    assert INDEX.search('smith', limit=2) == ['Smith, Anna', 'Smith, Ben']
+    # limit=None returns every prefix match and the fuzzy ones after them
+    assert INDEX.search('smith', limit=None) == ['Smith, Anna', 'Smith, Ben', 'Smithers, Ann', 'Anna Smith', 'Smyth, Ana']
+    assert INDEX.search('', limit=None) == []
+    assert NameIndex([]).search('smith', limit=None) == []
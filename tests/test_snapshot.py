@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from menlo_analytics.database import SeasonDatabase
+from menlo_analytics.roster import Roster
+from menlo_analytics.snapshot import export_snapshot, read_snapshot, restore_snapshot
+from menlo_analytics.store import PerformanceStore
+
+pytest.importorskip('pyarrow')
+
+ROSTER = Roster(
+    pd.DataFrame({'Athlete ID': [1, 2], 'Name': ['Doe, Jane', 'Roe, Sam'], 'Position': ['Skill', 'Line']}),
+    ['Skill', 'Line']
+)
+WEEKS = {
+    1: pd.DataFrame({'Name': ['Doe, Jane', 'Roe, Sam'], 'Bench Press (lbs)': [185.0, 225.0]}),
+    2: pd.DataFrame({'Name': ['Doe, Jane'], 'Bench Press (lbs)': [190.0]}),
+}
+
+def saved_store(path, team, season, roster, weeks):
+    database = SeasonDatabase(path, team, season)
+    database.save_roster(roster.frame)
+    store = PerformanceStore(roster, database=database)
+    store.save_weeks(weeks, {1: pd.Timestamp('2025-08-14')})
+    return store
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_snapshot_round_trip(tmp_path, fmt):
+    source = saved_store(str(tmp_path / 'a.db'), 'Football', '2025', ROSTER, WEEKS)
+    
+    roster, week_dfs, session_dates, info = read_snapshot(export_snapshot(source, 'Football', '2025', fmt))
+    
+    assert (info['team'], info['season']) == ('Football', '2025')
+    assert roster.frame.equals(ROSTER.frame)
+    assert session_dates == {1: pd.Timestamp('2025-08-14')}
+    assert week_dfs[1]['Bench Press (lbs)'].tolist() == [185.0, 225.0]
+    # Scores and body weight change are not read back
+    assert not any(col.endswith(' Score') for col in week_dfs[1].columns)
+
+def test_failed_restore_leaves_season_unchanged(tmp_path, monkeypatch):
+    path = str(tmp_path / 'a.db')
+    other = Roster(pd.DataFrame({'Athlete ID': [7], 'Name': ['Poe, Al'], 'Position': ['GK']}), ['GK'])
+    target = saved_store(path, 'Soccer', '2025', other, {1: pd.DataFrame({'Name': ['Poe, Al'], 'Bench Press (lbs)': [100.0]})})
+    source = saved_store(str(tmp_path / 'b.db'), 'Football', '2025', ROSTER, WEEKS)
+    roster, week_dfs, session_dates, _ = read_snapshot(export_snapshot(source, 'Football', '2025'))
+    
+    def fail(*args):
+        raise RuntimeError("disk full")
+    
+    # The roster is written first; a failure after it must roll the roster back too
+    monkeypatch.setattr(SeasonDatabase, '_write_position_groups', fail)
+    with pytest.raises(RuntimeError):
+        restore_snapshot(target, roster, week_dfs, session_dates)
+    
+    database = SeasonDatabase(path, 'Soccer', '2025')
+    assert database.load_roster()['Name'].tolist() == ['Poe, Al']
+    assert database.saved_weeks() == {1: 1}
+    assert target.roster is other
+
+def test_open_store_picks_up_restore_from_another_process(tmp_path):
+    path = str(tmp_path / 'a.db')
+    other = Roster(pd.DataFrame({'Athlete ID': [7], 'Name': ['Poe, Al'], 'Position': ['GK']}), ['GK'])
+    dashboard = saved_store(path, 'Football', '2025', other, {1: pd.DataFrame({'Name': ['Poe, Al'], 'Bench Press (lbs)': [100.0]})})
+    source = saved_store(str(tmp_path / 'b.db'), 'Football', '2025', ROSTER, WEEKS)
+    export_file = tmp_path / 'season.arrow'
+    export_file.write_bytes(export_snapshot(source, 'Football', '2025', 'arrow'))
+    
+    subprocess.run(
+        [sys.executable, '-m', 'menlo_analytics', '--db', path, '--team', 'Football', '--season', '2025', 'import', str(export_file)],
+        check=True, capture_output=True, cwd=os.path.dirname(os.path.dirname(__file__))
+    )
+    
+    assert dashboard.refresh()
+    assert dashboard.roster.names == ['Doe, Jane', 'Roe, Sam']
+    assert dashboard.roster.position_groups == ['Skill', 'Line']
+    assert dashboard.athlete_series('Roe, Sam', 'Bench Press (lbs)').tolist() == [225.0]
+    assert not dashboard.refresh()